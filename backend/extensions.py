@@ -5,10 +5,14 @@ This module initializes and configures Flask extensions used throughout
 the application including database, authentication, and CORS handling.
 """
 
+from flask import current_app
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager
 from flask_cors import CORS
 from flask_mail import Mail
+from flask_migrate import Migrate
+from sqlalchemy import event
+from sqlalchemy.orm import raiseload
 
 # Database extension
 db = SQLAlchemy()
@@ -21,3 +25,25 @@ cors = CORS()
 # Mail extension for sending emails
 mail = Mail()
 
+# Schema migrations (Alembic) for the database models
+migrate = Migrate()
+
+
+@event.listens_for(db.session, 'do_orm_execute')
+def _raiseload_by_default(execute_state):
+    """
+    Make unplanned lazy loads raise when ``RAISELOAD`` is enabled.
+
+    Only top-level ORM selects get the option; lazy loads and attribute
+    refreshes issued by the ORM itself are left alone. Relationships a
+    query really needs must be requested with selectinload()/joinedload().
+    """
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.is_relationship_load
+        and current_app.config.get('RAISELOAD')
+    ):
+        execute_state.statement = execute_state.statement.options(
+            raiseload('*', sql_only=True)
+        )
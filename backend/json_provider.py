@@ -0,0 +1,50 @@
+"""
+JSON Provider for Wedding Planning System.
+
+This module replaces Flask's standard-library JSON handling with orjson,
+which serializes response payloads in C and returns bytes directly.
+"""
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    
+    Values orjson cannot serialize natively (Decimal, and datetimes, which
+    Flask renders as HTTP dates) fall back to Flask's default encoder so
+    responses keep the same shape.
+    
+    Keys are emitted in insertion order and responses are compact even in
+    debug mode; set ``sort_keys`` / ``compact`` on ``app.json`` to change it.
+    """
+
+    sort_keys = False
+    compact = True
+
+    def _options(self, indent=False):
+        """Build the orjson option flags for the current provider settings."""
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs):
+        """Serialize data as a JSON string."""
+        option = self._options(indent=bool(kwargs.get('indent')))
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize data from a JSON string or bytes."""
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Serialize the arguments straight to a bytes JSON response."""
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = orjson.dumps(obj, default=self.default, option=self._options(indent=indent))
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
@@ -0,0 +1,127 @@
+"""legacy schema fixes
+
+Replaces the schema patching that used to run on every application start:
+profile and role_flags columns on users, moving company details off users,
+the checklist_tasks assignee rename / title widening, and the users(role, id)
+index. Each step checks the live schema first, since databases created by
+older releases differ in which of these they already have.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 06:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+LEGACY_COMPANY_COLUMNS = (
+    'company_name', 'company_email', 'company_phone', 'company_address', 'company_description'
+)
+ROLE_FLAGS = {'coordinator': 1, 'planner': 2, 'admin': 4}
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    tables = set(inspector.get_table_names())
+
+    user_columns = {col['name'] for col in inspector.get_columns('users')}
+    _upgrade_users(bind, user_columns)
+    _migrate_company_profile_data(bind, user_columns)
+
+    user_indexes = {index['name'] for index in inspector.get_indexes('users')}
+    if 'ix_users_role_id' not in user_indexes:
+        with op.batch_alter_table('users', schema=None) as batch_op:
+            batch_op.create_index('ix_users_role_id', ['role', 'id'], unique=False)
+
+    _upgrade_checklist_tasks(inspector)
+
+    # Version marker table used by the old startup schema pass
+    if 'schema_meta' in tables:
+        op.drop_table('schema_meta')
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index('ix_users_role_id')
+        batch_op.drop_column('role_flags')
+
+
+def _upgrade_users(bind, user_columns):
+    """Add profile and role flag columns missing on older users tables."""
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        if 'phone_number' not in user_columns:
+            batch_op.add_column(sa.Column('phone_number', sa.String(length=30), nullable=True))
+        if 'address' not in user_columns:
+            batch_op.add_column(sa.Column('address', sa.Text(), nullable=True))
+        if 'role_flags' not in user_columns:
+            batch_op.add_column(
+                sa.Column('role_flags', sa.SmallInteger(), nullable=False, server_default='0')
+            )
+
+    if 'role_flags' not in user_columns:
+        case_sql = ' '.join(f"WHEN '{role}' THEN {flag}" for role, flag in ROLE_FLAGS.items())
+        bind.execute(sa.text(f"UPDATE users SET role_flags = CASE role {case_sql} ELSE 0 END"))
+
+
+def _migrate_company_profile_data(bind, user_columns):
+    """Move company profile fields from users to company and drop the old columns."""
+    if not user_columns.intersection(LEGACY_COMPANY_COLUMNS):
+        return
+
+    existing_company = bind.execute(sa.text("SELECT id FROM company LIMIT 1")).fetchone()
+    present = [column for column in LEGACY_COMPANY_COLUMNS if column in user_columns]
+    if not existing_company:
+        row = bind.execute(sa.text(f"""
+            SELECT {', '.join(present)}
+            FROM users
+            WHERE {' OR '.join(f'{column} IS NOT NULL' for column in present)}
+            ORDER BY id ASC
+            LIMIT 1
+        """)).mappings().fetchone()
+        if row:
+            bind.execute(sa.text("""
+                INSERT INTO company (name, email, phone, address, description, created_at, updated_at)
+                VALUES (:name, :email, :phone, :address, :description, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+            """), {
+                'name': row.get('company_name'),
+                'email': row.get('company_email'),
+                'phone': row.get('company_phone'),
+                'address': row.get('company_address'),
+                'description': row.get('company_description'),
+            })
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        for column in present + (['company_id'] if 'company_id' in user_columns else []):
+            batch_op.drop_column(column)
+
+
+def _upgrade_checklist_tasks(inspector):
+    """Apply the assignee rename and title widening to older checklist_tasks tables."""
+    columns = {col['name']: col for col in inspector.get_columns('checklist_tasks')}
+
+    with op.batch_alter_table('checklist_tasks', schema=None) as batch_op:
+        if 'assignee_id' in columns and 'assigned_to' not in columns:
+            batch_op.alter_column(
+                'assignee_id',
+                new_column_name='assigned_to',
+                existing_type=sa.Integer(),
+                existing_nullable=True,
+            )
+
+        title_length = getattr(columns.get('title', {}).get('type'), 'length', None)
+        if title_length and title_length < 255:
+            batch_op.alter_column(
+                'title',
+                type_=sa.String(length=255),
+                existing_type=sa.String(length=title_length),
+                existing_nullable=False,
+            )
@@ -0,0 +1,58 @@
+"""enum columns to strings
+
+users.role, projects.status and checklist_tasks.status become VARCHAR(20)
+columns guarded by CHECK constraints instead of native ENUM types, so the
+allowed values can change without redefining the column type.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16 06:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+# (table, column, constraint name, allowed values, enum name used before)
+ENUM_COLUMNS = (
+    ('users', 'role', 'ck_users_role', ('admin', 'planner', 'coordinator'), None),
+    ('projects', 'status', 'ck_projects_status',
+     ('planning', 'confirmed', 'in_progress', 'completed', 'cancelled'), None),
+    ('checklist_tasks', 'status', 'ck_checklist_tasks_status',
+     ('pending', 'in_progress', 'completed'), 'task_status'),
+)
+
+
+def _in_list(column, values):
+    return "{} IN ({})".format(column, ', '.join(f"'{value}'" for value in values))
+
+
+def upgrade():
+    for table, column, constraint, values, enum_name in ENUM_COLUMNS:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.Enum(*values, name=enum_name),
+                type_=sa.String(length=20),
+                existing_nullable=False
+            )
+            batch_op.create_check_constraint(constraint, _in_list(column, values))
+
+
+def downgrade():
+    for table, column, constraint, values, enum_name in reversed(ENUM_COLUMNS):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_constraint(constraint, type_='check')
+            batch_op.alter_column(
+                column,
+                existing_type=sa.String(length=20),
+                type_=sa.Enum(*values, name=enum_name),
+                existing_nullable=False
+            )
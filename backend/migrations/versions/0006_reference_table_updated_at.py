@@ -0,0 +1,40 @@
+"""updated_at on reference tables
+
+Adds updated_at to cultural_colors, color_rules, food_locations and
+restricted_colours. Existing rows get the migration time; the admin list
+endpoints derive their ETags from max(updated_at) and the row count.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-16 06:55:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+TABLES = ('cultural_colors', 'color_rules', 'food_locations', 'restricted_colours')
+
+
+def upgrade():
+    for table in TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(sa.Column(
+                'updated_at',
+                sa.DateTime(),
+                server_default=sa.text('CURRENT_TIMESTAMP'),
+                nullable=False
+            ))
+
+
+def downgrade():
+    for table in reversed(TABLES):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_column('updated_at')
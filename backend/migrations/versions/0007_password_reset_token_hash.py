@@ -0,0 +1,60 @@
+"""store password reset tokens as SHA-256 digests
+
+Renames password_reset_tokens.token to token_hash and replaces each stored
+token with its hex SHA-256 digest, so links already sent keep working.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-16 07:20:00.000000
+
+"""
+import hashlib
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('password_reset_tokens', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_password_reset_tokens_token'))
+        batch_op.alter_column(
+            'token',
+            new_column_name='token_hash',
+            existing_type=sa.String(length=64),
+            existing_nullable=False
+        )
+    # Indexed in a second batch so SQLite's table copy sees the new name
+    with op.batch_alter_table('password_reset_tokens', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_password_reset_tokens_token_hash'), ['token_hash'], unique=True)
+
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT id, token_hash FROM password_reset_tokens")).all()
+    for row_id, token in rows:
+        bind.execute(
+            sa.text("UPDATE password_reset_tokens SET token_hash = :token_hash WHERE id = :id"),
+            {'token_hash': hashlib.sha256(token.encode()).hexdigest(), 'id': row_id}
+        )
+
+
+def downgrade():
+    # Digests cannot be turned back into tokens; the outstanding ones are
+    # dropped and users request a new link
+    op.execute("DELETE FROM password_reset_tokens")
+
+    with op.batch_alter_table('password_reset_tokens', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_password_reset_tokens_token_hash'))
+        batch_op.alter_column(
+            'token_hash',
+            new_column_name='token',
+            existing_type=sa.String(length=64),
+            existing_nullable=False
+        )
+    with op.batch_alter_table('password_reset_tokens', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_password_reset_tokens_token'), ['token'], unique=True)
@@ -0,0 +1,38 @@
+"""write counters for the reference tables
+
+Adds reference_table_versions with one row per admin-managed reference
+table. The admin data endpoints bump a table's version with every write and
+the list ETags include it, since the row count and the second-precision
+updated_at can stay the same across writes made within one second.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-16 07:45:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+
+TABLES = ('wedding_types', 'cultural_colors', 'color_rules', 'food_locations', 'restricted_colours')
+
+
+def upgrade():
+    versions = op.create_table(
+        'reference_table_versions',
+        sa.Column('table_name', sa.String(length=64), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('table_name')
+    )
+    op.bulk_insert(versions, [{'table_name': table, 'version': 0} for table in TABLES])
+
+
+def downgrade():
+    op.drop_table('reference_table_versions')
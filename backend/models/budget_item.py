@@ -32,23 +32,27 @@ class BudgetItem(db.Model):
         nullable=False
     )
 
-    project = db.relationship('Project', backref=db.backref('budget_items', lazy='dynamic'))
-    creator = db.relationship('User', backref=db.backref('budget_items', lazy='dynamic'))
+    project = db.relationship('Project', backref=db.backref('budget_items', lazy='select'))
+    creator = db.relationship('User', backref=db.backref('budget_items', lazy='select'))
 
     def to_dict(self):
         """Serialize model to dictionary for JSON responses."""
+        # Read each instrumented date attribute once
+        expense_date = self.expense_date
+        created_at = self.created_at
+        updated_at = self.updated_at
         return {
             'id': self.id,
             'project_id': self.project_id,
             'category': self.category,
-            'planned_amount': float(self.planned_amount) if self.planned_amount is not None else 0.0,
-            'actual_amount': float(self.actual_amount) if self.actual_amount is not None else 0.0,
-            'expense_date': self.expense_date.isoformat() if self.expense_date else None,
+            'planned_amount': float(self.planned_amount or 0),
+            'actual_amount': float(self.actual_amount or 0),
+            'expense_date': expense_date.isoformat() if expense_date else None,
             'vendor': self.vendor,
             'notes': self.notes,
             'created_by': self.created_by,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'created_at': created_at.isoformat() if created_at else None,
+            'updated_at': updated_at.isoformat() if updated_at else None,
         }
 
     def __repr__(self):
@@ -5,16 +5,33 @@ Stores per-project checklist items that can be assigned to planners and
 tracked through their lifecycle.
 """
 
-from datetime import datetime, date
+from datetime import datetime
+
+from sqlalchemy import event, select, update
 
 from extensions import db
+from models.user import User
 
 
 class ChecklistTask(db.Model):
     """Represents a single task within a project's checklist."""
 
     __tablename__ = "checklist_tasks"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        # Task list: WHERE project_id = ? ORDER BY due_date, ...
+        db.Index("ix_checklist_tasks_project_due", "project_id", "due_date"),
+        # Coordinator lookups by assignee (project ids, access checks,
+        # pending-task counts) are answered from the index alone
+        db.Index(
+            "ix_checklist_tasks_assigned_project_status",
+            "assigned_to", "project_id", "status",
+        ),
+        db.CheckConstraint(
+            "status IN ('pending', 'in_progress', 'completed')",
+            name="ck_checklist_tasks_status",
+        ),
+        {"extend_existing": True},
+    )
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     project_id = db.Column(
@@ -25,17 +42,17 @@ class ChecklistTask(db.Model):
     )
     title = db.Column(db.String(255), nullable=False)
     description = db.Column(db.Text, nullable=True)
-    status = db.Column(
-        db.Enum("pending", "in_progress", "completed", name="task_status"),
-        nullable=False,
-        default="pending",
-    )
+    status = db.Column(db.String(20), nullable=False, default="pending")
     due_date = db.Column(db.Date, nullable=True)
     assigned_to = db.Column(
         db.Integer,
         db.ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
     )
+    # Copies of the assignee's name/email so task reads skip the users join;
+    # kept current by assign_to() and the User after_update listener below
+    assignee_name_cache = db.Column(db.String(100), nullable=True)
+    assignee_email_cache = db.Column(db.String(255), nullable=True)
     created_by = db.Column(
         db.Integer,
         db.ForeignKey("users.id", ondelete="SET NULL"),
@@ -52,83 +69,126 @@ class ChecklistTask(db.Model):
     )
 
     project = db.relationship(
-        "Project", backref=db.backref("checklist_tasks", lazy="dynamic")
+        "Project", backref=db.backref("checklist_tasks", lazy="select")
     )
     assignee = db.relationship(
         "User",
         foreign_keys=[assigned_to],
-        backref=db.backref("assigned_tasks", lazy="dynamic"),
+        backref=db.backref("assigned_tasks", lazy="select"),
     )
     creator = db.relationship(
         "User",
         foreign_keys=[created_by],
-        backref=db.backref("created_tasks", lazy="dynamic"),
+        backref=db.backref("created_tasks", lazy="select"),
     )
 
+    def assign_to(self, user):
+        """
+        Assign the task to a user (or unassign with None).
+        
+        Args:
+            user (User): Assignee, or None to clear the assignment
+        """
+        self.assigned_to = user.id if user else None
+        self.assignee_name_cache = user.name if user else None
+        self.assignee_email_cache = user.email if user else None
+
     def to_dict(self):
         """Serialize task for API responses."""
-        try:
-            # Safely access assignee relationship
-            assignee_name = None
-            assignee_email = None
-            if self.assigned_to:
-                try:
-                    if self.assignee:
-                        assignee_name = self.assignee.name if hasattr(self.assignee, 'name') else None
-                        assignee_email = self.assignee.email if hasattr(self.assignee, 'email') else None
-                except Exception:
-                    # Relationship might not be loaded or user doesn't exist
-                    pass
-            
-            # Safely format dates
-            due_date_str = None
-            if self.due_date:
-                if isinstance(self.due_date, date):
-                    due_date_str = self.due_date.isoformat()
-                elif hasattr(self.due_date, 'isoformat'):
-                    due_date_str = self.due_date.isoformat()
-            
-            created_at_str = None
-            if self.created_at:
-                if hasattr(self.created_at, 'isoformat'):
-                    created_at_str = self.created_at.isoformat()
-            
-            updated_at_str = None
-            if self.updated_at:
-                if hasattr(self.updated_at, 'isoformat'):
-                    updated_at_str = self.updated_at.isoformat()
-            
-            return {
-                "id": self.id,
-                "project_id": self.project_id,
-                "title": self.title or "",
-                "description": self.description or None,
-                "status": self.status or "pending",
-                "due_date": due_date_str,
-                "assigned_to": self.assigned_to,
-                "assigned_to_name": assignee_name,
-                "assigned_to_email": assignee_email,
-                "created_by": self.created_by,
-                "created_at": created_at_str,
-                "updated_at": updated_at_str,
-            }
-        except Exception as e:
-            # Fallback serialization if something goes wrong
-            return {
-                "id": self.id,
-                "project_id": getattr(self, 'project_id', None),
-                "title": getattr(self, 'title', ''),
-                "description": getattr(self, 'description', None),
-                "status": getattr(self, 'status', 'pending'),
-                "due_date": None,
-                "assigned_to": getattr(self, 'assigned_to', None),
-                "assigned_to_name": None,
-                "assigned_to_email": None,
-                "created_by": getattr(self, 'created_by', None),
-                "created_at": None,
-                "updated_at": None,
-            }
+        assigned = self.assigned_to is not None
+        due_date = self.due_date
+        created_at = self.created_at
+        updated_at = self.updated_at
+        return {
+            "id": self.id,
+            "project_id": self.project_id,
+            "title": self.title or "",
+            "description": self.description or None,
+            "status": self.status,
+            "due_date": due_date.isoformat() if due_date else None,
+            "assigned_to": self.assigned_to,
+            "assigned_to_name": self.assignee_name_cache if assigned else None,
+            "assigned_to_email": self.assignee_email_cache if assigned else None,
+            "created_by": self.created_by,
+            "created_at": created_at.isoformat() if created_at else None,
+            "updated_at": updated_at.isoformat() if updated_at else None,
+        }
+
+    @staticmethod
+    def list_dicts_for_project(project_id, assigned_to=None):
+        """
+        Return a project's tasks already shaped like ``to_dict()``.
+
+        Reads plain rows (including the cached assignee name and email)
+        instead of building ORM objects, for the read-only task list.
+
+        Args:
+            project_id (int): Project whose tasks are listed
+            assigned_to (int, optional): Only include tasks assigned to this user
+
+        Returns:
+            list: Task dictionaries ordered by due date, status and creation time
+        """
+        stmt = (
+            select(
+                ChecklistTask.id,
+                ChecklistTask.project_id,
+                ChecklistTask.title,
+                ChecklistTask.description,
+                ChecklistTask.status,
+                ChecklistTask.due_date,
+                ChecklistTask.assigned_to,
+                ChecklistTask.assignee_name_cache,
+                ChecklistTask.assignee_email_cache,
+                ChecklistTask.created_by,
+                ChecklistTask.created_at,
+                ChecklistTask.updated_at,
+            )
+            .where(ChecklistTask.project_id == project_id)
+            # MySQL doesn't support NULLS LAST in ORDER BY; order by fields directly
+            .order_by(
+                ChecklistTask.due_date.asc(),
+                ChecklistTask.status.asc(),
+                ChecklistTask.created_at.asc(),
+            )
+        )
+        if assigned_to is not None:
+            stmt = stmt.where(ChecklistTask.assigned_to == assigned_to)
+
+        tasks = []
+        for row in db.session.execute(stmt):
+            due_date = row.due_date
+            created_at = row.created_at
+            updated_at = row.updated_at
+            assigned = row.assigned_to is not None
+            tasks.append({
+                "id": row.id,
+                "project_id": row.project_id,
+                "title": row.title or "",
+                "description": row.description or None,
+                "status": row.status,
+                "due_date": due_date.isoformat() if due_date else None,
+                "assigned_to": row.assigned_to,
+                "assigned_to_name": row.assignee_name_cache if assigned else None,
+                "assigned_to_email": row.assignee_email_cache if assigned else None,
+                "created_by": row.created_by,
+                "created_at": created_at.isoformat() if created_at else None,
+                "updated_at": updated_at.isoformat() if updated_at else None,
+            })
+        return tasks
 
     def __repr__(self):
         return f"<ChecklistTask {self.id} Project {self.project_id} - {self.title}>"
 
+
+@event.listens_for(User, "after_update")
+def _refresh_assignee_cache(mapper, connection, user):
+    """Copy a user's changed name/email onto the tasks assigned to them."""
+    state = db.inspect(user)
+    if not (state.attrs.name.history.has_changes() or state.attrs.email.history.has_changes()):
+        return
+    connection.execute(
+        update(ChecklistTask.__table__)
+        .where(ChecklistTask.__table__.c.assigned_to == user.id)
+        .values(assignee_name_cache=user.name, assignee_email_cache=user.email)
+    )
@@ -5,7 +5,10 @@ This module defines the PasswordResetToken model for managing
 password reset requests with secure tokens and expiration.
 """
 
+import hashlib
+import secrets
 from datetime import datetime, timedelta
+from sqlalchemy import delete, insert
 from extensions import db
 
 
@@ -14,11 +17,16 @@ class PasswordResetToken(db.Model):
     Password reset token model for secure password recovery.
     
     Stores reset tokens with expiration times and tracks usage
-    to ensure one-time use and prevent abuse.
+    to ensure one-time use and prevent abuse. Only a SHA-256 digest of each
+    token is stored, so the table's contents cannot be used as reset links.
     """
     
     __tablename__ = 'password_reset_tokens'
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Unused-token invalidation and validity checks per user
+        db.Index('ix_password_reset_tokens_user_used_expires', 'user_id', 'used', 'expires_at'),
+        {'extend_existing': True},
+    )
 
     # Primary key
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
@@ -31,8 +39,8 @@ class PasswordResetToken(db.Model):
         index=True
     )
     
-    # Token string (unique, indexed for fast lookup)
-    token = db.Column(db.String(64), unique=True, nullable=False, index=True)
+    # Hex SHA-256 digest of the token (unique, indexed for fast lookup)
+    token_hash = db.Column(db.String(64), unique=True, nullable=False, index=True)
     
     # Expiration timestamp
     expires_at = db.Column(db.DateTime, nullable=False, index=True)
@@ -48,7 +56,20 @@ class PasswordResetToken(db.Model):
     )
 
     # Relationship to User
-    user = db.relationship('User', backref=db.backref('password_reset_tokens', lazy='dynamic'))
+    user = db.relationship('User', backref=db.backref('password_reset_tokens', lazy='select'))
+
+    @staticmethod
+    def hash_token(token):
+        """
+        Return the digest stored for a token.
+        
+        Args:
+            token (str): Token as sent to the user
+            
+        Returns:
+            str: Hex SHA-256 digest of the token
+        """
+        return hashlib.sha256(token.encode()).hexdigest()
 
     @staticmethod
     def create_token(user_id, expiration_hours=1):
@@ -60,10 +81,9 @@ class PasswordResetToken(db.Model):
             expiration_hours (int): Number of hours until token expires (default: 1)
             
         Returns:
-            PasswordResetToken: The created token object
+            PasswordResetToken: The created token object; the token itself is
+            only available as its unmapped ``token`` attribute
         """
-        import secrets
-        
         # Generate secure random token
         token = secrets.token_urlsafe(32)
         
@@ -73,13 +93,41 @@ class PasswordResetToken(db.Model):
         # Create token record
         reset_token = PasswordResetToken(
             user_id=user_id,
-            token=token,
+            token_hash=PasswordResetToken.hash_token(token),
             expires_at=expires_at,
             used=False
         )
+        reset_token.token = token
         
         return reset_token
 
+    @staticmethod
+    def issue_token(user_id, expiration_hours=1):
+        """
+        Insert a new password reset token for a user and return its value.
+        
+        Uses a single Core INSERT rather than an ORM object, so nothing is
+        added to the session or reloaded after commit. The caller commits.
+        
+        Args:
+            user_id (int): ID of the user requesting password reset
+            expiration_hours (int): Number of hours until token expires (default: 1)
+            
+        Returns:
+            str: The generated token string
+        """
+        token = secrets.token_urlsafe(32)
+        db.session.execute(
+            insert(PasswordResetToken).values(
+                user_id=user_id,
+                token_hash=PasswordResetToken.hash_token(token),
+                expires_at=datetime.utcnow() + timedelta(hours=expiration_hours),
+                used=False,
+                created_at=datetime.utcnow()
+            )
+        )
+        return token
+
     def is_valid(self):
         """
         Check if token is valid (not used and not expired).
@@ -109,9 +157,12 @@ class PasswordResetToken(db.Model):
         This can be called periodically to clean up old tokens.
         """
         try:
-            expired_count = PasswordResetToken.query.filter(
+            # Single bulk DELETE (range scan on the expires_at index); the
+            # session is not synchronized since tokens are not kept loaded
+            stmt = delete(PasswordResetToken).where(
                 PasswordResetToken.expires_at < datetime.utcnow()
-            ).delete()
+            ).execution_options(synchronize_session=False)
+            expired_count = db.session.execute(stmt).rowcount
             db.session.commit()
             return expired_count
         except Exception:
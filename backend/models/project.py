@@ -6,6 +6,7 @@ including client details, wedding specifications, and theme suggestions.
 """
 
 from datetime import datetime
+from sqlalchemy import func
 from extensions import db
 
 
@@ -18,7 +19,17 @@ class Project(db.Model):
     """
     
     __tablename__ = 'projects'
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Planner project lists and dashboard counts filter on either
+        # column together with status
+        db.Index('ix_projects_created_by_status', 'created_by', 'status'),
+        db.Index('ix_projects_assigned_to_status', 'assigned_to', 'status'),
+        db.CheckConstraint(
+            "status IN ('planning', 'confirmed', 'in_progress', 'completed', 'cancelled')",
+            name='ck_projects_status'
+        ),
+        {'extend_existing': True},
+    )
 
     # Primary key
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
@@ -38,8 +49,7 @@ class Project(db.Model):
     bride_color = db.Column(db.String(50), nullable=True)
     
     # Project management
-    status = db.Column(db.Enum('planning', 'confirmed', 'in_progress', 'completed', 'cancelled'), 
-                      default='planning', nullable=False)
+    status = db.Column(db.String(20), default='planning', nullable=False)
     budget = db.Column(db.Float, default=0.0)
     notes = db.Column(db.Text, nullable=True)
     
@@ -63,6 +73,10 @@ class Project(db.Model):
         Returns:
             dict: Project data as dictionary
         """
+        # Read each instrumented date attribute once
+        wedding_date = self.wedding_date
+        created_at = self.created_at
+        updated_at = self.updated_at
         return {
             'id': self.id,
             'company_id': self.company_id,
@@ -70,16 +84,16 @@ class Project(db.Model):
             'groom_name': self.groom_name,
             'contact_number': self.contact_number,
             'contact_email': self.contact_email,
-            'wedding_date': self.wedding_date.isoformat() if self.wedding_date else None,
+            'wedding_date': wedding_date.isoformat() if wedding_date else None,
             'wedding_type': self.wedding_type,
             'bride_color': self.bride_color,
             'status': self.status,
-            'budget': float(self.budget) if self.budget else None,
+            'budget': self.budget,
             'notes': self.notes,
             'created_by': self.created_by,
             'assigned_to': self.assigned_to,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': created_at.isoformat() if created_at else None,
+            'updated_at': updated_at.isoformat() if updated_at else None
         }
 
     def to_theme_dict(self):
@@ -89,12 +103,13 @@ class Project(db.Model):
         Returns:
             dict: Project data formatted for theme suggestions
         """
+        wedding_date = self.wedding_date
         return {
             'id': self.id,
             'company_id': self.company_id,
             'bride_name': self.bride_name,
             'groom_name': self.groom_name,
-            'wedding_date': self.wedding_date.isoformat() if self.wedding_date else None,
+            'wedding_date': wedding_date.isoformat() if wedding_date else None,
             'wedding_type': self.wedding_type,
             'bride_color': self.bride_color,
             'status': self.status
@@ -108,13 +123,9 @@ class Project(db.Model):
         Returns:
             str: Unique project ID in format WED001, WED002, etc.
         """
-        # Get the highest existing project ID
-        last_project = Project.query.order_by(Project.id.desc()).first()
-        
-        if last_project:
-            next_number = last_project.id + 1
-        else:
-            next_number = 1
+        # Read only the highest existing project ID (no Project row is loaded)
+        last_id = db.session.query(func.coalesce(func.max(Project.id), 0)).scalar()
+        next_number = last_id + 1
         
         return f"WED{next_number:03d}"
 
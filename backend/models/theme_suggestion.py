@@ -35,7 +35,7 @@ class ThemeSuggestion(db.Model):
         nullable=False
     )
 
-    project = db.relationship('Project', backref=db.backref('theme_suggestions', lazy='dynamic'))
+    project = db.relationship('Project', backref=db.backref('theme_suggestions', lazy='select'))
 
     def to_dict(self):
         return {
@@ -7,10 +7,28 @@ and role-based access control for the wedding planning system.
 
 from datetime import datetime
 from flask_login import UserMixin
-from werkzeug.security import generate_password_hash, check_password_hash
+from sqlalchemy.orm import validates
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from werkzeug.security import check_password_hash
 
 from extensions import db
 
+# Role bit flags mirrored into User.role_flags for cheap integer role checks
+COORDINATOR_FLAG = 1
+PLANNER_FLAG = 2
+ADMIN_FLAG = 4
+ROLE_FLAGS = {
+    'coordinator': COORDINATOR_FLAG,
+    'planner': PLANNER_FLAG,
+    'admin': ADMIN_FLAG,
+}
+
+# argon2id at the OWASP baseline (19 MiB, 2 passes, 1 lane); verifying costs a
+# fraction of Werkzeug's default scrypt hash on every login
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+_ARGON2_PREFIX = '$argon2'
+
 
 class User(UserMixin, db.Model):
     """
@@ -24,7 +42,12 @@ class User(UserMixin, db.Model):
     """
     
     __tablename__ = 'users'
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Covers admin listings filtered by role and ordered by id
+        db.Index('ix_users_role_id', 'role', 'id'),
+        db.CheckConstraint("role IN ('admin', 'planner', 'coordinator')", name='ck_users_role'),
+        {'extend_existing': True},
+    )
 
     # Primary key
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
@@ -39,7 +62,9 @@ class User(UserMixin, db.Model):
     phone_number = db.Column(db.String(30), nullable=True)
     address = db.Column(db.Text, nullable=True)
     
-    role = db.Column(db.Enum('admin', 'planner', 'coordinator'), nullable=False)
+    role = db.Column(db.String(20), nullable=False)
+    # Bit flags derived from role (see ROLE_FLAGS), kept in sync by _sync_role_flags
+    role_flags = db.Column(db.SmallInteger, nullable=False, default=0)
     
     # Timestamps
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
@@ -50,6 +75,12 @@ class User(UserMixin, db.Model):
         nullable=False
     )
 
+    @validates('role')
+    def _sync_role_flags(self, key, role):
+        """Keep role_flags in step with every assignment to role."""
+        self.role_flags = ROLE_FLAGS.get(role, 0)
+        return role
+
     def set_password(self, password):
         """
         Hash and set user password.
@@ -57,19 +88,38 @@ class User(UserMixin, db.Model):
         Args:
             password (str): Plain text password to hash and store
         """
-        self.password = generate_password_hash(password)
+        self.password = _password_hasher.hash(password)
 
     def check_password(self, password):
         """
         Verify password against stored hash.
         
+        Hashes created before the switch to argon2 (Werkzeug pbkdf2/scrypt)
+        are still accepted; see ``password_needs_rehash``.
+        
         Args:
             password (str): Plain text password to verify
             
         Returns:
             bool: True if password matches, False otherwise
         """
-        return check_password_hash(self.password, password)
+        if not self.password.startswith(_ARGON2_PREFIX):
+            return check_password_hash(self.password, password)
+        try:
+            return _password_hasher.verify(self.password, password)
+        except (VerificationError, InvalidHashError):
+            return False
+
+    def password_needs_rehash(self):
+        """
+        Check whether the stored hash is legacy or uses outdated parameters.
+        
+        Returns:
+            bool: True if the password should be re-hashed on next login
+        """
+        if not self.password.startswith(_ARGON2_PREFIX):
+            return True
+        return _password_hasher.check_needs_rehash(self.password)
 
     def get_id(self):
         """
@@ -125,6 +175,52 @@ class User(UserMixin, db.Model):
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
+    
+    @staticmethod
+    def list_dicts(limit=None, offset=0):
+        """
+        Return users already shaped like ``to_dict()``, newest first.
+        
+        Reads plain column rows instead of building ORM objects, for the
+        read-only user list.
+        
+        Args:
+            limit (int, optional): Maximum number of users to return; all when None
+            offset (int): Number of users to skip
+        
+        Returns:
+            list: User dictionaries ordered by creation time, descending
+        """
+        stmt = db.select(
+            User.id,
+            User.email,
+            User.username,
+            User.name,
+            User.phone_number,
+            User.address,
+            User.role,
+            User.created_at,
+            User.updated_at,
+        ).order_by(User.created_at.desc(), User.id.desc())
+        if limit is not None:
+            stmt = stmt.limit(limit).offset(offset)
+        rows = db.session.execute(stmt)
+        users = []
+        for row in rows:
+            created_at = row.created_at
+            updated_at = row.updated_at
+            users.append({
+                'id': row.id,
+                'email': row.email,
+                'username': row.username,
+                'name': row.name,
+                'phone_number': row.phone_number,
+                'address': row.address,
+                'role': row.role,
+                'created_at': created_at.isoformat() if created_at else None,
+                'updated_at': updated_at.isoformat() if updated_at else None
+            })
+        return users
         
     def __repr__(self):
         """String representation of User object."""
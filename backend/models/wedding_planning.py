@@ -33,6 +33,14 @@ class CulturalColors(db.Model):
     rgb = db.Column(db.String(20), nullable=False)
     cultural_significance = db.Column(db.String(100), nullable=True)
 
+    updated_at = db.Column(
+        db.DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        server_default=db.func.current_timestamp(),
+        nullable=False
+    )
+
     def to_dict(self):
         """Convert to dictionary representation."""
         return {
@@ -68,6 +76,14 @@ class ColorRules(db.Model):
     flower_deco_colour = db.Column(db.String(50), nullable=False)
     hall_decor_colour = db.Column(db.String(50), nullable=False)
 
+    updated_at = db.Column(
+        db.DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        server_default=db.func.current_timestamp(),
+        nullable=False
+    )
+
     def to_dict(self):
         """Convert to dictionary representation."""
         return {
@@ -103,6 +119,14 @@ class FoodLocations(db.Model):
     drinks = db.Column(db.Text, nullable=False)
     pre_shoot_locations = db.Column(db.Text, nullable=False)
 
+    updated_at = db.Column(
+        db.DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        server_default=db.func.current_timestamp(),
+        nullable=False
+    )
+
     def to_dict(self):
         """Convert to dictionary representation."""
         return {
@@ -161,6 +185,14 @@ class RestrictedColours(db.Model):
     wedding_type = db.Column(db.String(50), primary_key=True, nullable=False)
     restricted_colour = db.Column(db.String(20), primary_key=True, nullable=False)
 
+    updated_at = db.Column(
+        db.DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        server_default=db.func.current_timestamp(),
+        nullable=False
+    )
+
     def to_dict(self):
         """Convert to dictionary representation."""
         return {
@@ -207,4 +239,23 @@ class WeddingType(db.Model):
         }
 
     def __repr__(self):
-        return f'<WeddingType {self.name}>'
\ No newline at end of file
+        return f'<WeddingType {self.name}>'
+
+class ReferenceTableVersion(db.Model):
+    """
+    Model for counting admin writes to each reference table.
+    
+    The admin data endpoints bump a table's version in the same transaction
+    as every create, update and delete, and the list ETags include it, so
+    each write changes them even when it leaves the row count and the
+    second-precision ``updated_at`` as they were.
+    """
+    
+    __tablename__ = 'reference_table_versions'
+    __table_args__ = {'extend_existing': True}
+
+    table_name = db.Column(db.String(64), primary_key=True, nullable=False)
+    version = db.Column(db.Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return f'<ReferenceTableVersion {self.table_name}: {self.version}>'
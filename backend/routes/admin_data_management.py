@@ -9,32 +9,98 @@ Provides CRUD API endpoints for administrators to manage:
 - Restricted Colours
 """
 
-from functools import wraps
+from itertools import groupby, islice
+import hashlib
+import logging
 import re
 
-from flask import Blueprint, jsonify, request
-from flask_login import current_user, login_required
-from sqlalchemy import and_
+import orjson
+from flask import Blueprint, current_app, jsonify, make_response, request, stream_with_context
+from flask_login import current_user
+from sqlalchemy import and_, delete, exists, func, or_, select, update
+from sqlalchemy.exc import IntegrityError
 from werkzeug.exceptions import NotFound
 
 from extensions import db
+from models.user import ADMIN_FLAG
 from models.wedding_planning import (
-    WeddingType, CulturalColors, ColorRules, FoodLocations, RestrictedColours
+    WeddingType, CulturalColors, ColorRules, FoodLocations, RestrictedColours,
+    ReferenceTableVersion
 )
+from services import theme_cache
+
+logger = logging.getLogger(__name__)
 
 admin_data_bp = Blueprint('admin_data', __name__, url_prefix='/api/admin/data')
 
+# RGB input formats accepted by _validate_rgb
+_HEX6_RE = re.compile(r'^#?([0-9A-Fa-f]{6})$')
+_RGB_FUNC_RE = re.compile(r'rgb\((\d+),\s*(\d+),\s*(\d+)\)')
+
+# Tables that reference a wedding type by name, with their labels in the
+# "cannot delete" message
+_WEDDING_TYPE_REFERENCES = (
+    (CulturalColors, 'Cultural Color'),
+    (ColorRules, 'Color Rule'),
+    (FoodLocations, 'Food & Location'),
+    (RestrictedColours, 'Restricted Colour'),
+)
+
+# Food & location body fields, all required, with their labels in the
+# "is required" message
+_FOOD_LOCATION_FIELDS = (
+    ('wedding_type', 'Wedding type'),
+    ('food_menu', 'Food menu'),
+    ('drinks', 'Drinks'),
+    ('pre_shoot_locations', 'Pre-shoot locations'),
+)
+
 
-def _admin_required(fn):
-    """Decorator to ensure the current user is an authenticated admin."""
-    @wraps(fn)
-    def wrapper(*args, **kwargs):
-        if not current_user.is_authenticated:
-            return jsonify({'error': 'Login required'}), 401
-        if current_user.role != 'admin':
-            return jsonify({'error': 'Admin access required'}), 403
-        return fn(*args, **kwargs)
-    return wrapper
+@admin_data_bp.before_request
+def _require_admin():
+    """Ensure every admin data request comes from an authenticated admin."""
+    # CORS preflight requests carry no credentials
+    if request.method == 'OPTIONS':
+        return
+    
+    # Resolve the LocalProxy once instead of on each attribute access
+    user = current_user._get_current_object()
+    if not user.is_authenticated:
+        return jsonify({'error': 'Login required'}), 401
+    if not (user.role_flags & ADMIN_FLAG):
+        return jsonify({'error': 'Admin access required'}), 403
+
+
+def _wedding_type_exists(name):
+    """
+    Check that a wedding type name exists.
+    
+    Names in the cached snapshot are trusted; a miss is confirmed against the
+    database so a type just created by another worker is not rejected.
+    """
+    if name in theme_cache.wedding_type_names():
+        return True
+    return db.session.execute(select(exists().where(WeddingType.name == name))).scalar()
+
+
+def _read_required_fields(data, fields):
+    """
+    Read and strip the required text fields of a request body.
+    
+    Args:
+        data (dict): Request body
+        fields (tuple): (key, label) pairs, checked in order
+    
+    Returns:
+        tuple: (dict of stripped values by key, error message or None)
+    """
+    values = {}
+    for key, label in fields:
+        value = (data.get(key) or '').strip()
+        if not value:
+            return values, f'{label} is required'
+        values[key] = value
+    return values, None
 
 
 def _validate_rgb(rgb_string):
@@ -49,22 +115,22 @@ def _validate_rgb(rgb_string):
     rgb_string = rgb_string.strip()
     
     # Check for hex format (#FFFFFF or FFFFFF)
+    hex_match = _HEX6_RE.match(rgb_string)
+    if hex_match:
+        # Convert hex to RGB format
+        value = int(hex_match.group(1), 16)
+        return True, f"{value >> 16},{(value >> 8) & 0xFF},{value & 0xFF}", None
+    
+    # The other formats also tolerate a leading '#'
     if rgb_string.startswith('#'):
         rgb_string = rgb_string[1:]
     
-    if re.match(r'^[0-9A-Fa-f]{6}$', rgb_string):
-        # Convert hex to RGB format
-        r = int(rgb_string[0:2], 16)
-        g = int(rgb_string[2:4], 16)
-        b = int(rgb_string[4:6], 16)
-        return True, f"{r},{g},{b}", None
-    
     # Check for rgb(r, g, b) format
-    rgb_match = re.match(r'rgb\((\d+),\s*(\d+),\s*(\d+)\)', rgb_string)
+    rgb_match = _RGB_FUNC_RE.match(rgb_string)
     if rgb_match:
-        r, g, b = rgb_match.groups()
-        r, g, b = int(r), int(g), int(b)
-        if 0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255:
+        # The pattern only matches unsigned digits, so only the upper bound needs checking
+        r, g, b = map(int, rgb_match.groups())
+        if max(r, g, b) <= 255:
             return True, f"{r},{g},{b}", None
         return False, None, "RGB values must be between 0 and 255"
     
@@ -72,7 +138,8 @@ def _validate_rgb(rgb_string):
     parts = rgb_string.split(',')
     if len(parts) == 3:
         try:
-            r, g, b = int(parts[0].strip()), int(parts[1].strip()), int(parts[2].strip())
+            # int() already ignores surrounding whitespace
+            r, g, b = map(int, parts)
             if 0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255:
                 return True, f"{r},{g},{b}", None
             return False, None, "RGB values must be between 0 and 255"
@@ -82,32 +149,295 @@ def _validate_rgb(rgb_string):
     return False, None, "Invalid RGB format. Use '255,255,255', '#FFFFFF', or 'rgb(255,255,255)'"
 
 
+# ============================================================================
+# LIST QUERIES
+# Column rows skip ORM instance construction; the dict keys match each
+# model's to_dict(). Rows are fetched from the cursor in batches, so a list
+# can be streamed without holding every row in memory. The reads never need
+# pending changes flushed first, so autoflush is turned off for them.
+# ============================================================================
+
+# Rows fetched from the cursor, and rows written to the response, per batch
+_LIST_BATCH_SIZE = 500
+
+
+def _execute_read(stmt):
+    """Execute a list query in batches, without autoflush."""
+    return db.session.execute(
+        stmt.execution_options(yield_per=_LIST_BATCH_SIZE, autoflush=False)
+    )
+
+
+def _iter_row_dicts(stmt):
+    """
+    Yield the rows of a column select as dictionaries.
+    
+    The column names are resolved once instead of per row as
+    ``Row._asdict()`` would.
+    """
+    result = _execute_read(stmt)
+    keys = list(result.keys())
+    for row in result:
+        yield dict(zip(keys, row))
+
+
+def _iter_wedding_types():
+    """Yield all wedding types ordered by name."""
+    rows = _execute_read(select(
+        WeddingType.id,
+        WeddingType.name,
+        WeddingType.description,
+        WeddingType.is_active,
+        WeddingType.created_at,
+        WeddingType.updated_at
+    ).order_by(WeddingType.name))
+    for row in rows:
+        yield {
+            'id': row.id,
+            'name': row.name,
+            'description': row.description,
+            'is_active': row.is_active,
+            'created_at': row.created_at.isoformat() if row.created_at else None,
+            'updated_at': row.updated_at.isoformat() if row.updated_at else None
+        }
+
+
+def _iter_cultural_colors(wedding_type=None):
+    """Yield cultural colors, optionally only those of one wedding type."""
+    stmt = select(
+        CulturalColors.wedding_type,
+        CulturalColors.colour_name,
+        CulturalColors.rgb,
+        CulturalColors.cultural_significance
+    )
+    if wedding_type:
+        stmt = stmt.where(CulturalColors.wedding_type == wedding_type)
+    return _iter_row_dicts(stmt.order_by(
+        CulturalColors.wedding_type,
+        CulturalColors.colour_name
+    ))
+
+
+def _iter_color_rules(wedding_type=None):
+    """Yield color rules, optionally only those of one wedding type."""
+    stmt = select(
+        ColorRules.wedding_type,
+        ColorRules.bride_colour,
+        ColorRules.groom_colour,
+        ColorRules.bridesmaids_colour,
+        ColorRules.best_men_colour,
+        ColorRules.flower_deco_colour,
+        ColorRules.hall_decor_colour
+    )
+    if wedding_type:
+        stmt = stmt.where(ColorRules.wedding_type == wedding_type)
+    return _iter_row_dicts(stmt.order_by(
+        ColorRules.wedding_type,
+        ColorRules.bride_colour
+    ))
+
+
+def _iter_food_locations(wedding_type=None):
+    """Yield food & locations, optionally only the one of a wedding type."""
+    stmt = select(
+        FoodLocations.wedding_type,
+        FoodLocations.food_menu,
+        FoodLocations.drinks,
+        FoodLocations.pre_shoot_locations
+    )
+    if wedding_type:
+        stmt = stmt.where(FoodLocations.wedding_type == wedding_type)
+    return _iter_row_dicts(stmt.order_by(FoodLocations.wedding_type))
+
+
+def _iter_restricted_colours(wedding_type=None):
+    """Yield restricted colours, optionally only those of one wedding type."""
+    stmt = select(
+        RestrictedColours.wedding_type,
+        RestrictedColours.restricted_colour
+    )
+    if wedding_type:
+        stmt = stmt.where(RestrictedColours.wedding_type == wedding_type)
+    return _iter_row_dicts(stmt.order_by(
+        RestrictedColours.wedding_type,
+        RestrictedColours.restricted_colour
+    ))
+
+
+def _iter_restricted_colour_groups(wedding_type=None):
+    """
+    Yield one entry per wedding type with its list of restricted colours.
+    
+    Groups the ordered rows of ``_iter_restricted_colours()`` as they stream
+    by; GROUP_CONCAT is avoided because MySQL truncates its result at
+    ``group_concat_max_len`` (1024 bytes by default).
+    """
+    rows = _iter_restricted_colours(wedding_type)
+    for name, group in groupby(rows, key=lambda row: row['wedding_type']):
+        yield {
+            'wedding_type': name,
+            'colours': [row['restricted_colour'] for row in group]
+        }
+
+
+def _stream_list(key, rows):
+    """
+    Return ``{key: [...]}`` as JSON, streaming lists longer than one batch.
+    
+    The first batch is read before the response starts, so connection and
+    query errors still reach the view's error handling as a JSON 500, and
+    lists that fit in one batch are answered without streaming. An error
+    later in the stream is logged and ends the body early; the unclosed
+    array makes the client fail to parse it rather than show a partial list.
+    
+    Args:
+        key (str): Response key holding the list
+        rows (iterable): Row dictionaries
+    
+    Returns:
+        Response: JSON response, streamed when the list exceeds one batch
+    """
+    rows = iter(rows)
+    first_batch = list(islice(rows, _LIST_BATCH_SIZE))
+    if len(first_batch) < _LIST_BATCH_SIZE:
+        return jsonify({key: first_batch})
+
+    def generate():
+        # One dumps per batch; [1:-1] drops the array brackets
+        yield b'{' + orjson.dumps(key) + b':[' + orjson.dumps(first_batch)[1:-1]
+        try:
+            batch = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) == _LIST_BATCH_SIZE:
+                    yield b',' + orjson.dumps(batch)[1:-1]
+                    batch = []
+            if batch:
+                yield b',' + orjson.dumps(batch)[1:-1]
+        except Exception:
+            logger.exception("Error streaming %s list", key)
+            return
+        yield b']}\n'
+
+    # Keep the request (and its database session) alive while streaming
+    return current_app.response_class(
+        stream_with_context(generate()), mimetype='application/json'
+    )
+
+
+def _bump_list_version(model):
+    """
+    Count a write to ``model``'s table in the current transaction.
+    
+    Called right before the commit of every admin write so the list ETags
+    change even when the row count and latest ``updated_at`` stay the same.
+    """
+    result = db.session.execute(
+        update(ReferenceTableVersion)
+        .where(ReferenceTableVersion.table_name == model.__tablename__)
+        .values(version=ReferenceTableVersion.version + 1)
+    )
+    if result.rowcount == 0:
+        db.session.add(ReferenceTableVersion(table_name=model.__tablename__, version=1))
+
+
+def _list_etag(model, wedding_type=None, representation=''):
+    """
+    Compute the ETag of a list from the table's write version, row count and
+    latest ``updated_at``.
+    
+    The version changes with every write through the admin endpoints, while
+    ``updated_at`` only has one-second precision on MySQL; the count and
+    ``updated_at`` still catch rows changed outside the endpoints.
+    ``representation`` tells apart different shapes of the same rows.
+    """
+    version = select(ReferenceTableVersion.version).where(
+        ReferenceTableVersion.table_name == model.__tablename__
+    ).scalar_subquery()
+    stmt = select(func.count(), func.max(model.updated_at), version)
+    if wedding_type:
+        stmt = stmt.where(model.wedding_type == wedding_type)
+    count, last_updated, table_version = db.session.execute(
+        stmt.execution_options(autoflush=False)
+    ).one()
+    token = (
+        f"{model.__tablename__}:{representation}:{wedding_type or ''}:"
+        f"{table_version}:{count}:{last_updated}"
+    )
+    return hashlib.blake2s(token.encode(), digest_size=8).hexdigest()
+
+
+def _conditional_list(model, key, build, wedding_type=None):
+    """
+    Return a list response, or 304 when the client's ETag still matches.
+    
+    Args:
+        model: Model whose rows are listed
+        key (str): Response key holding the list
+        build (callable): Yields the row dictionaries; receives ``wedding_type`` when given
+        wedding_type (str, optional): Wedding type filter
+    
+    Returns:
+        Response: 200 with the list or an empty 304, carrying the ETag
+    """
+    etag = _list_etag(model, wedding_type, build.__name__)
+    if request.if_none_match.contains(etag):
+        response = make_response('', 304)
+    else:
+        rows = build(wedding_type) if wedding_type else build()
+        response = _stream_list(key, rows)
+    response.set_etag(etag)
+    # Browsers keep the copy but revalidate it on every request, so an
+    # admin never sees a list from before their own edit
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+# ============================================================================
+# BOOTSTRAP
+# ============================================================================
+
+@admin_data_bp.route('/bootstrap', methods=['GET'])
+def bootstrap():
+    """
+    Get every reference table in one response.
+    
+    Lets the admin page load all of its tabs with a single request instead
+    of one request per table. The lists are read in the request's one
+    transaction and use the same shapes as the individual list endpoints.
+    """
+    try:
+        return jsonify({
+            'wedding_types': list(_iter_wedding_types()),
+            'cultural_colors': list(_iter_cultural_colors()),
+            'color_rules': list(_iter_color_rules()),
+            'food_locations': list(_iter_food_locations()),
+            'restricted_colours': list(_iter_restricted_colours())
+        }), 200
+    except Exception as e:
+        logger.exception("Error loading admin reference data")
+        return jsonify({'error': 'Failed to retrieve reference data', 'details': str(e)}), 500
+
+
 # ============================================================================
 # WEDDING TYPES ENDPOINTS
 # ============================================================================
 
 @admin_data_bp.route('/wedding-types', methods=['GET'])
-@login_required
-@_admin_required
 def list_wedding_types():
     """Get all wedding types."""
     try:
-        wedding_types = WeddingType.query.order_by(WeddingType.name).all()
-        return jsonify({
-            'wedding_types': [wt.to_dict() for wt in wedding_types]
-        }), 200
+        return _conditional_list(WeddingType, 'wedding_types', _iter_wedding_types)
     except Exception as e:
-        print(f"Error listing wedding types: {e}")
+        logger.exception("Error listing wedding types")
         return jsonify({'error': 'Failed to retrieve wedding types', 'details': str(e)}), 500
 
 
 @admin_data_bp.route('/wedding-types', methods=['POST'])
-@login_required
-@_admin_required
 def create_wedding_type():
     """Create a new wedding type."""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True)
         if not data:
             return jsonify({'error': 'Request body is required'}), 400
         
@@ -118,11 +448,6 @@ def create_wedding_type():
         if not name:
             return jsonify({'error': 'Wedding type name is required'}), 400
         
-        # Check for duplicates
-        existing = WeddingType.query.filter_by(name=name).first()
-        if existing:
-            return jsonify({'error': f'Wedding type "{name}" already exists'}), 409
-        
         wedding_type = WeddingType(
             name=name,
             description=description,
@@ -130,7 +455,14 @@ def create_wedding_type():
         )
         
         db.session.add(wedding_type)
-        db.session.commit()
+        try:
+            _bump_list_version(WeddingType)
+            db.session.commit()
+        except IntegrityError:
+            # The unique index on name rejects duplicates; no SELECT beforehand
+            db.session.rollback()
+            return jsonify({'error': f'Wedding type "{name}" already exists'}), 409
+        theme_cache.invalidate_wedding_types()
         
         return jsonify({
             'message': 'Wedding type created successfully',
@@ -139,18 +471,16 @@ def create_wedding_type():
         
     except Exception as e:
         db.session.rollback()
-        print(f"Error creating wedding type: {e}")
+        logger.exception("Error creating wedding type")
         return jsonify({'error': 'Failed to create wedding type', 'details': str(e)}), 500
 
 
 @admin_data_bp.route('/wedding-types/<int:wedding_type_id>', methods=['PUT'])
-@login_required
-@_admin_required
 def update_wedding_type(wedding_type_id):
     """Update a wedding type."""
     try:
-        wedding_type = WeddingType.query.get_or_404(wedding_type_id)
-        data = request.get_json()
+        wedding_type = db.get_or_404(WeddingType, wedding_type_id)
+        data = request.get_json(silent=True)
         
         if not data:
             return jsonify({'error': 'Request body is required'}), 400
@@ -163,10 +493,10 @@ def update_wedding_type(wedding_type_id):
             return jsonify({'error': 'Wedding type name is required'}), 400
         
         # Check for duplicates (excluding current record)
-        existing = WeddingType.query.filter(
+        existing = db.session.execute(select(exists().where(
             WeddingType.name == name,
             WeddingType.id != wedding_type_id
-        ).first()
+        ))).scalar()
         if existing:
             return jsonify({'error': f'Wedding type "{name}" already exists'}), 409
         
@@ -174,7 +504,9 @@ def update_wedding_type(wedding_type_id):
         wedding_type.description = description
         wedding_type.is_active = is_active
         
+        _bump_list_version(WeddingType)
         db.session.commit()
+        theme_cache.invalidate_wedding_types()
         
         return jsonify({
             'message': 'Wedding type updated successfully',
@@ -183,49 +515,47 @@ def update_wedding_type(wedding_type_id):
         
     except Exception as e:
         db.session.rollback()
-        print(f"Error updating wedding type: {e}")
+        logger.exception("Error updating wedding type")
         return jsonify({'error': 'Failed to update wedding type', 'details': str(e)}), 500
 
 
 @admin_data_bp.route('/wedding-types/<int:wedding_type_id>', methods=['DELETE'])
-@login_required
-@_admin_required
 def delete_wedding_type(wedding_type_id):
     """Delete a wedding type (with relationship checks)."""
     try:
-        wedding_type = WeddingType.query.get_or_404(wedding_type_id)
-        
-        # Check for related records
-        cultural_colors_count = CulturalColors.query.filter_by(wedding_type=wedding_type.name).count()
-        color_rules_count = ColorRules.query.filter_by(wedding_type=wedding_type.name).count()
-        food_locations_count = FoodLocations.query.filter_by(wedding_type=wedding_type.name).count()
-        restricted_colours_count = RestrictedColours.query.filter_by(wedding_type=wedding_type.name).count()
-        
-        total_references = cultural_colors_count + color_rules_count + food_locations_count + restricted_colours_count
-        
-        if total_references > 0:
-            references = []
-            if cultural_colors_count > 0:
-                references.append(f"{cultural_colors_count} Cultural Color(s)")
-            if color_rules_count > 0:
-                references.append(f"{color_rules_count} Color Rule(s)")
-            if food_locations_count > 0:
-                references.append(f"{food_locations_count} Food & Location(s)")
-            if restricted_colours_count > 0:
-                references.append(f"{restricted_colours_count} Restricted Colour(s)")
+        wedding_type = db.get_or_404(WeddingType, wedding_type_id)
+        
+        # Check for related records: one EXISTS round trip, exact counts
+        # (for the error message) only when something references the type
+        name = wedding_type.name
+        is_referenced = db.session.execute(
+            select(or_(*(
+                exists().where(model.wedding_type == name)
+                for model, _ in _WEDDING_TYPE_REFERENCES
+            )))
+        ).scalar()
+        
+        if is_referenced:
+            counts = (
+                (model.query.filter_by(wedding_type=name).count(), label)
+                for model, label in _WEDDING_TYPE_REFERENCES
+            )
+            references = [f"{count} {label}(s)" for count, label in counts if count]
             
             return jsonify({
                 'error': f'Cannot delete wedding type "{wedding_type.name}" because it is used in: {", ".join(references)}. Please delete related records first.'
             }), 409
         
         db.session.delete(wedding_type)
+        _bump_list_version(WeddingType)
         db.session.commit()
+        theme_cache.invalidate_wedding_types()
         
         return jsonify({'message': 'Wedding type deleted successfully'}), 200
         
     except Exception as e:
         db.session.rollback()
-        print(f"Error deleting wedding type: {e}")
+        logger.exception("Error deleting wedding type")
         return jsonify({'error': 'Failed to delete wedding type', 'details': str(e)}), 500
 
 
@@ -234,37 +564,21 @@ def delete_wedding_type(wedding_type_id):
 # ============================================================================
 
 @admin_data_bp.route('/cultural-colors', methods=['GET'])
-@login_required
-@_admin_required
 def list_cultural_colors():
     """Get all cultural colors, optionally filtered by wedding type."""
     try:
         wedding_type = request.args.get('wedding_type')
-        
-        query = CulturalColors.query
-        if wedding_type:
-            query = query.filter_by(wedding_type=wedding_type)
-        
-        cultural_colors = query.order_by(
-            CulturalColors.wedding_type,
-            CulturalColors.colour_name
-        ).all()
-        
-        return jsonify({
-            'cultural_colors': [cc.to_dict() for cc in cultural_colors]
-        }), 200
+        return _conditional_list(CulturalColors, 'cultural_colors', _iter_cultural_colors, wedding_type)
     except Exception as e:
-        print(f"Error listing cultural colors: {e}")
+        logger.exception("Error listing cultural colors")
         return jsonify({'error': 'Failed to retrieve cultural colors', 'details': str(e)}), 500
 
 
 @admin_data_bp.route('/cultural-colors', methods=['POST'])
-@login_required
-@_admin_required
 def create_cultural_color():
     """Create a new cultural color."""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True)
         if not data:
             return jsonify({'error': 'Request body is required'}), 400
         
@@ -286,20 +600,9 @@ def create_cultural_color():
             return jsonify({'error': error_msg}), 400
         
         # Check if wedding type exists
-        wedding_type_obj = WeddingType.query.filter_by(name=wedding_type).first()
-        if not wedding_type_obj:
+        if not _wedding_type_exists(wedding_type):
             return jsonify({'error': f'Wedding type "{wedding_type}" does not exist'}), 400
         
-        # Check for duplicates
-        existing = CulturalColors.query.filter_by(
-            wedding_type=wedding_type,
-            colour_name=colour_name
-        ).first()
-        if existing:
-            return jsonify({
-                'error': f'Cultural color "{colour_name}" for "{wedding_type}" already exists'
-            }), 409
-        
         cultural_color = CulturalColors(
             wedding_type=wedding_type,
             colour_name=colour_name,
@@ -308,7 +611,17 @@ def create_cultural_color():
         )
         
         db.session.add(cultural_color)
-        db.session.commit()
+        try:
+            _bump_list_version(CulturalColors)
+            db.session.commit()
+        except IntegrityError:
+            # The primary key rejects duplicates; no SELECT beforehand
+            db.session.rollback()
+            return jsonify({
+                'error': f'Cultural color "{colour_name}" for "{wedding_type}" already exists'
+            }), 409
+        theme_cache.invalidate()
+        theme_cache.invalidate_cultural_colors()
         
         return jsonify({
             'message': 'Cultural color created successfully',
@@ -317,17 +630,15 @@ def create_cultural_color():
         
     except Exception as e:
         db.session.rollback()
-        print(f"Error creating cultural color: {e}")
+        logger.exception("Error creating cultural color")
         return jsonify({'error': 'Failed to create cultural color', 'details': str(e)}), 500
 
 
 @admin_data_bp.route('/cultural-colors', methods=['PUT'])
-@login_required
-@_admin_required
 def update_cultural_color():
     """Update a cultural color (composite key requires both wedding_type and colour_name)."""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True)
         if not data:
             return jsonify({'error': 'Request body is required'}), 400
         
@@ -351,31 +662,30 @@ def update_cultural_color():
             return jsonify({'error': error_msg}), 400
         
         # Find existing record
-        cultural_color = CulturalColors.query.filter_by(
-            wedding_type=old_wedding_type,
-            colour_name=old_colour_name
-        ).first()
+        cultural_color = db.session.get(CulturalColors, (old_wedding_type, old_colour_name))
         
         if not cultural_color:
             return jsonify({'error': 'Cultural color not found'}), 404
         
-        # Check if wedding type exists (if changed)
+        # If the key changed, check the wedding type and duplicates for the
+        # new key in one round trip
         if wedding_type != old_wedding_type or colour_name != old_colour_name:
-            wedding_type_obj = WeddingType.query.filter_by(name=wedding_type).first()
-            if not wedding_type_obj:
+            wedding_type_exists, duplicate_exists = db.session.execute(
+                select(
+                    exists().where(WeddingType.name == wedding_type),
+                    exists().where(and_(
+                        CulturalColors.wedding_type == wedding_type,
+                        CulturalColors.colour_name == colour_name
+                    ))
+                )
+            ).one()
+            if not wedding_type_exists:
                 return jsonify({'error': f'Wedding type "{wedding_type}" does not exist'}), 400
-            
-            # Check for duplicates (if key changed)
-            existing = CulturalColors.query.filter_by(
-                wedding_type=wedding_type,
-                colour_name=colour_name
-            ).first()
-            if existing:
+            if duplicate_exists:
                 return jsonify({
                     'error': f'Cultural color "{colour_name}" for "{wedding_type}" already exists'
                 }), 409
         
-        # Update record (delete old and create new if composite key changed)
         if wedding_type != old_wedding_type or colour_name != old_colour_name:
             # Check if used in color_rules
             color_rules_count = ColorRules.query.filter_by(
@@ -387,24 +697,18 @@ def update_cultural_color():
                 return jsonify({
                     'error': f'Cannot update because this color is used in {color_rules_count} Color Rule(s). Please delete related records first.'
                 }), 409
-            
-            # Delete old and create new
-            db.session.delete(cultural_color)
-            db.session.flush()
-            
-            cultural_color = CulturalColors(
-                wedding_type=wedding_type,
-                colour_name=colour_name,
-                rgb=normalized_rgb,
-                cultural_significance=cultural_significance
-            )
-            db.session.add(cultural_color)
-        else:
-            # Just update fields
-            cultural_color.rgb = normalized_rgb
-            cultural_color.cultural_significance = cultural_significance
         
+        # Update in place; a composite key change is flushed as a single
+        # UPDATE of the primary key columns
+        cultural_color.wedding_type = wedding_type
+        cultural_color.colour_name = colour_name
+        cultural_color.rgb = normalized_rgb
+        cultural_color.cultural_significance = cultural_significance
+        
+        _bump_list_version(CulturalColors)
         db.session.commit()
+        theme_cache.invalidate()
+        theme_cache.invalidate_cultural_colors()
         
         return jsonify({
             'message': 'Cultural color updated successfully',
@@ -413,13 +717,11 @@ def update_cultural_color():
         
     except Exception as e:
         db.session.rollback()
-        print(f"Error updating cultural color: {e}")
+        logger.exception("Error updating cultural color")
         return jsonify({'error': 'Failed to update cultural color', 'details': str(e)}), 500
 
 
 @admin_data_bp.route('/cultural-colors', methods=['DELETE'])
-@login_required
-@_admin_required
 def delete_cultural_color():
     """Delete a cultural color (composite key requires both wedding_type and colour_name)."""
     try:
@@ -429,10 +731,7 @@ def delete_cultural_color():
         if not wedding_type or not colour_name:
             return jsonify({'error': 'Both wedding_type and colour_name are required'}), 400
         
-        cultural_color = CulturalColors.query.filter_by(
-            wedding_type=wedding_type,
-            colour_name=colour_name
-        ).first_or_404()
+        cultural_color = db.get_or_404(CulturalColors, (wedding_type, colour_name))
         
         # Check for related records in color_rules
         color_rules_count = ColorRules.query.filter_by(
@@ -446,7 +745,10 @@ def delete_cultural_color():
             }), 409
         
         db.session.delete(cultural_color)
+        _bump_list_version(CulturalColors)
         db.session.commit()
+        theme_cache.invalidate()
+        theme_cache.invalidate_cultural_colors()
         
         return jsonify({'message': 'Cultural color deleted successfully'}), 200
         
@@ -454,7 +756,7 @@ def delete_cultural_color():
         return jsonify({'error': 'Cultural color not found'}), 404
     except Exception as e:
         db.session.rollback()
-        print(f"Error deleting cultural color: {e}")
+        logger.exception("Error deleting cultural color")
         return jsonify({'error': 'Failed to delete cultural color', 'details': str(e)}), 500
 
 
@@ -463,37 +765,21 @@ def delete_cultural_color():
 # ============================================================================
 
 @admin_data_bp.route('/color-rules', methods=['GET'])
-@login_required
-@_admin_required
 def list_color_rules():
     """Get all color rules, optionally filtered by wedding type."""
     try:
         wedding_type = request.args.get('wedding_type')
-        
-        query = ColorRules.query
-        if wedding_type:
-            query = query.filter_by(wedding_type=wedding_type)
-        
-        color_rules = query.order_by(
-            ColorRules.wedding_type,
-            ColorRules.bride_colour
-        ).all()
-        
-        return jsonify({
-            'color_rules': [cr.to_dict() for cr in color_rules]
-        }), 200
+        return _conditional_list(ColorRules, 'color_rules', _iter_color_rules, wedding_type)
     except Exception as e:
-        print(f"Error listing color rules: {e}")
+        logger.exception("Error listing color rules")
         return jsonify({'error': 'Failed to retrieve color rules', 'details': str(e)}), 500
 
 
 @admin_data_bp.route('/color-rules', methods=['POST'])
-@login_required
-@_admin_required
 def create_color_rule():
     """Create a new color rule."""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True)
         if not data:
             return jsonify({'error': 'Request body is required'}), 400
         
@@ -512,30 +798,26 @@ def create_color_rule():
         if not all([groom_colour, bridesmaids_colour, best_men_colour, flower_deco_colour, hall_decor_colour]):
             return jsonify({'error': 'All color fields are required'}), 400
         
-        # Check if wedding type exists
-        wedding_type_obj = WeddingType.query.filter_by(name=wedding_type).first()
-        if not wedding_type_obj:
-            return jsonify({'error': f'Wedding type "{wedding_type}" does not exist'}), 400
-        
-        # Check if bride color exists in cultural colors
-        cultural_color = CulturalColors.query.filter_by(
-            wedding_type=wedding_type,
-            colour_name=bride_colour
-        ).first()
-        if not cultural_color:
-            return jsonify({
-                'error': f'Bride color "{bride_colour}" does not exist for wedding type "{wedding_type}" in Cultural Colors'
-            }), 400
-        
-        # Check for duplicates
-        existing = ColorRules.query.filter_by(
-            wedding_type=wedding_type,
-            bride_colour=bride_colour
-        ).first()
-        if existing:
-            return jsonify({
-                'error': f'Color rule for "{wedding_type}" with bride color "{bride_colour}" already exists'
-            }), 409
+        # Check that the wedding type and the bride color exist. Cached keys
+        # are trusted; a miss is confirmed against the database in one round
+        # trip so rows just added by another worker are not rejected.
+        if (wedding_type not in theme_cache.wedding_type_names()
+                or (wedding_type, bride_colour) not in theme_cache.cultural_color_keys()):
+            wedding_type_exists, bride_colour_exists = db.session.execute(
+                select(
+                    exists().where(WeddingType.name == wedding_type),
+                    exists().where(and_(
+                        CulturalColors.wedding_type == wedding_type,
+                        CulturalColors.colour_name == bride_colour
+                    ))
+                )
+            ).one()
+            if not wedding_type_exists:
+                return jsonify({'error': f'Wedding type "{wedding_type}" does not exist'}), 400
+            if not bride_colour_exists:
+                return jsonify({
+                    'error': f'Bride color "{bride_colour}" does not exist for wedding type "{wedding_type}" in Cultural Colors'
+                }), 400
         
         color_rule = ColorRules(
             wedding_type=wedding_type,
@@ -548,7 +830,16 @@ def create_color_rule():
         )
         
         db.session.add(color_rule)
-        db.session.commit()
+        try:
+            _bump_list_version(ColorRules)
+            db.session.commit()
+        except IntegrityError:
+            # The primary key rejects duplicates; no SELECT beforehand
+            db.session.rollback()
+            return jsonify({
+                'error': f'Color rule for "{wedding_type}" with bride color "{bride_colour}" already exists'
+            }), 409
+        theme_cache.invalidate()
         
         return jsonify({
             'message': 'Color rule created successfully',
@@ -557,17 +848,15 @@ def create_color_rule():
         
     except Exception as e:
         db.session.rollback()
-        print(f"Error creating color rule: {e}")
+        logger.exception("Error creating color rule")
         return jsonify({'error': 'Failed to create color rule', 'details': str(e)}), 500
 
 
 @admin_data_bp.route('/color-rules', methods=['PUT'])
-@login_required
-@_admin_required
 def update_color_rule():
     """Update a color rule (composite key requires both wedding_type and bride_colour)."""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True)
         if not data:
             return jsonify({'error': 'Request body is required'}), 400
         
@@ -589,65 +878,51 @@ def update_color_rule():
             return jsonify({'error': 'All color fields are required'}), 400
         
         # Find existing record
-        color_rule = ColorRules.query.filter_by(
-            wedding_type=old_wedding_type,
-            bride_colour=old_bride_colour
-        ).first()
+        color_rule = db.session.get(ColorRules, (old_wedding_type, old_bride_colour))
         
         if not color_rule:
             return jsonify({'error': 'Color rule not found'}), 404
         
-        # Check if wedding type exists (if changed)
-        if wedding_type != old_wedding_type:
-            wedding_type_obj = WeddingType.query.filter_by(name=wedding_type).first()
-            if not wedding_type_obj:
-                return jsonify({'error': f'Wedding type "{wedding_type}" does not exist'}), 400
-        
-        # Check if bride color exists in cultural colors (if changed)
+        # If the key changed, check the wedding type, the bride color and
+        # duplicates for the new key in one round trip
         if wedding_type != old_wedding_type or bride_colour != old_bride_colour:
-            cultural_color = CulturalColors.query.filter_by(
-                wedding_type=wedding_type,
-                colour_name=bride_colour
-            ).first()
-            if not cultural_color:
+            wedding_type_exists, bride_colour_exists, duplicate_exists = db.session.execute(
+                select(
+                    exists().where(WeddingType.name == wedding_type),
+                    exists().where(and_(
+                        CulturalColors.wedding_type == wedding_type,
+                        CulturalColors.colour_name == bride_colour
+                    )),
+                    exists().where(and_(
+                        ColorRules.wedding_type == wedding_type,
+                        ColorRules.bride_colour == bride_colour
+                    ))
+                )
+            ).one()
+            if wedding_type != old_wedding_type and not wedding_type_exists:
+                return jsonify({'error': f'Wedding type "{wedding_type}" does not exist'}), 400
+            if not bride_colour_exists:
                 return jsonify({
                     'error': f'Bride color "{bride_colour}" does not exist for wedding type "{wedding_type}" in Cultural Colors'
                 }), 400
-            
-            # Check for duplicates (if key changed)
-            existing = ColorRules.query.filter_by(
-                wedding_type=wedding_type,
-                bride_colour=bride_colour
-            ).first()
-            if existing:
+            if duplicate_exists:
                 return jsonify({
                     'error': f'Color rule for "{wedding_type}" with bride color "{bride_colour}" already exists'
                 }), 409
         
-        # Update record (delete old and create new if composite key changed)
-        if wedding_type != old_wedding_type or bride_colour != old_bride_colour:
-            db.session.delete(color_rule)
-            db.session.flush()
-            
-            color_rule = ColorRules(
-                wedding_type=wedding_type,
-                bride_colour=bride_colour,
-                groom_colour=groom_colour,
-                bridesmaids_colour=bridesmaids_colour,
-                best_men_colour=best_men_colour,
-                flower_deco_colour=flower_deco_colour,
-                hall_decor_colour=hall_decor_colour
-            )
-            db.session.add(color_rule)
-        else:
-            # Just update fields
-            color_rule.groom_colour = groom_colour
-            color_rule.bridesmaids_colour = bridesmaids_colour
-            color_rule.best_men_colour = best_men_colour
-            color_rule.flower_deco_colour = flower_deco_colour
-            color_rule.hall_decor_colour = hall_decor_colour
-        
+        # Update in place; a composite key change is flushed as a single
+        # UPDATE of the primary key columns
+        color_rule.wedding_type = wedding_type
+        color_rule.bride_colour = bride_colour
+        color_rule.groom_colour = groom_colour
+        color_rule.bridesmaids_colour = bridesmaids_colour
+        color_rule.best_men_colour = best_men_colour
+        color_rule.flower_deco_colour = flower_deco_colour
+        color_rule.hall_decor_colour = hall_decor_colour
+        
+        _bump_list_version(ColorRules)
         db.session.commit()
+        theme_cache.invalidate()
         
         return jsonify({
             'message': 'Color rule updated successfully',
@@ -656,13 +931,11 @@ def update_color_rule():
         
     except Exception as e:
         db.session.rollback()
-        print(f"Error updating color rule: {e}")
+        logger.exception("Error updating color rule")
         return jsonify({'error': 'Failed to update color rule', 'details': str(e)}), 500
 
 
 @admin_data_bp.route('/color-rules', methods=['DELETE'])
-@login_required
-@_admin_required
 def delete_color_rule():
     """Delete a color rule (composite key requires both wedding_type and bride_colour)."""
     try:
@@ -672,13 +945,12 @@ def delete_color_rule():
         if not wedding_type or not bride_colour:
             return jsonify({'error': 'Both wedding_type and bride_colour are required'}), 400
         
-        color_rule = ColorRules.query.filter_by(
-            wedding_type=wedding_type,
-            bride_colour=bride_colour
-        ).first_or_404()
+        color_rule = db.get_or_404(ColorRules, (wedding_type, bride_colour))
         
         db.session.delete(color_rule)
+        _bump_list_version(ColorRules)
         db.session.commit()
+        theme_cache.invalidate()
         
         return jsonify({'message': 'Color rule deleted successfully'}), 200
         
@@ -686,7 +958,7 @@ def delete_color_rule():
         return jsonify({'error': 'Color rule not found'}), 404
     except Exception as e:
         db.session.rollback()
-        print(f"Error deleting color rule: {e}")
+        logger.exception("Error deleting color rule")
         return jsonify({'error': 'Failed to delete color rule', 'details': str(e)}), 500
 
 
@@ -695,72 +967,46 @@ def delete_color_rule():
 # ============================================================================
 
 @admin_data_bp.route('/food-locations', methods=['GET'])
-@login_required
-@_admin_required
 def list_food_locations():
     """Get all food & locations, optionally filtered by wedding type."""
     try:
         wedding_type = request.args.get('wedding_type')
-        
-        query = FoodLocations.query
-        if wedding_type:
-            query = query.filter_by(wedding_type=wedding_type)
-        
-        food_locations = query.order_by(FoodLocations.wedding_type).all()
-        
-        return jsonify({
-            'food_locations': [fl.to_dict() for fl in food_locations]
-        }), 200
+        return _conditional_list(FoodLocations, 'food_locations', _iter_food_locations, wedding_type)
     except Exception as e:
-        print(f"Error listing food locations: {e}")
+        logger.exception("Error listing food locations")
         return jsonify({'error': 'Failed to retrieve food & locations', 'details': str(e)}), 500
 
 
 @admin_data_bp.route('/food-locations', methods=['POST'])
-@login_required
-@_admin_required
 def create_food_location():
     """Create a new food & location entry."""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True)
         if not data:
             return jsonify({'error': 'Request body is required'}), 400
         
-        wedding_type = (data.get('wedding_type') or '').strip()
-        food_menu = (data.get('food_menu') or '').strip()
-        drinks = (data.get('drinks') or '').strip()
-        pre_shoot_locations = (data.get('pre_shoot_locations') or '').strip()
-        
-        if not wedding_type:
-            return jsonify({'error': 'Wedding type is required'}), 400
-        if not food_menu:
-            return jsonify({'error': 'Food menu is required'}), 400
-        if not drinks:
-            return jsonify({'error': 'Drinks is required'}), 400
-        if not pre_shoot_locations:
-            return jsonify({'error': 'Pre-shoot locations is required'}), 400
+        fields, error = _read_required_fields(data, _FOOD_LOCATION_FIELDS)
+        if error:
+            return jsonify({'error': error}), 400
+        wedding_type = fields['wedding_type']
         
         # Check if wedding type exists
-        wedding_type_obj = WeddingType.query.filter_by(name=wedding_type).first()
-        if not wedding_type_obj:
+        if not _wedding_type_exists(wedding_type):
             return jsonify({'error': f'Wedding type "{wedding_type}" does not exist'}), 400
         
-        # Check for duplicates
-        existing = FoodLocations.query.filter_by(wedding_type=wedding_type).first()
-        if existing:
+        food_location = FoodLocations(**fields)
+        
+        db.session.add(food_location)
+        try:
+            _bump_list_version(FoodLocations)
+            db.session.commit()
+        except IntegrityError:
+            # The primary key rejects duplicates; no SELECT beforehand
+            db.session.rollback()
             return jsonify({
                 'error': f'Food & locations for "{wedding_type}" already exists'
             }), 409
-        
-        food_location = FoodLocations(
-            wedding_type=wedding_type,
-            food_menu=food_menu,
-            drinks=drinks,
-            pre_shoot_locations=pre_shoot_locations
-        )
-        
-        db.session.add(food_location)
-        db.session.commit()
+        theme_cache.invalidate()
         
         return jsonify({
             'message': 'Food & location created successfully',
@@ -769,73 +1015,58 @@ def create_food_location():
         
     except Exception as e:
         db.session.rollback()
-        print(f"Error creating food location: {e}")
+        logger.exception("Error creating food location")
         return jsonify({'error': 'Failed to create food & location', 'details': str(e)}), 500
 
 
 @admin_data_bp.route('/food-locations', methods=['PUT'])
-@login_required
-@_admin_required
 def update_food_location():
     """Update a food & location entry."""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True)
         if not data:
             return jsonify({'error': 'Request body is required'}), 400
         
-        wedding_type = (data.get('wedding_type') or '').strip()
+        fields, error = _read_required_fields(data, _FOOD_LOCATION_FIELDS)
+        if error:
+            return jsonify({'error': error}), 400
+        wedding_type = fields['wedding_type']
         old_wedding_type = (data.get('old_wedding_type') or wedding_type).strip()
-        food_menu = (data.get('food_menu') or '').strip()
-        drinks = (data.get('drinks') or '').strip()
-        pre_shoot_locations = (data.get('pre_shoot_locations') or '').strip()
         
-        if not wedding_type:
-            return jsonify({'error': 'Wedding type is required'}), 400
-        if not food_menu:
-            return jsonify({'error': 'Food menu is required'}), 400
-        if not drinks:
-            return jsonify({'error': 'Drinks is required'}), 400
-        if not pre_shoot_locations:
-            return jsonify({'error': 'Pre-shoot locations is required'}), 400
-        
-        # Find existing record
-        food_location = FoodLocations.query.filter_by(wedding_type=old_wedding_type).first()
+        # Find existing record, locked until the commit so concurrent edits
+        # of the same entry apply one after the other
+        food_location = db.session.get(FoodLocations, old_wedding_type, with_for_update=True)
         
         if not food_location:
             return jsonify({'error': 'Food & location not found'}), 404
         
         # Check if wedding type exists (if changed)
         if wedding_type != old_wedding_type:
-            wedding_type_obj = WeddingType.query.filter_by(name=wedding_type).first()
-            if not wedding_type_obj:
+            if not _wedding_type_exists(wedding_type):
                 return jsonify({'error': f'Wedding type "{wedding_type}" does not exist'}), 400
             
             # Check for duplicates (if key changed)
-            existing = FoodLocations.query.filter_by(wedding_type=wedding_type).first()
+            existing = db.session.get(FoodLocations, wedding_type)
             if existing:
                 return jsonify({
                     'error': f'Food & locations for "{wedding_type}" already exists'
                 }), 409
         
-        # Update record (delete old and create new if key changed)
-        if wedding_type != old_wedding_type:
-            db.session.delete(food_location)
-            db.session.flush()
-            
-            food_location = FoodLocations(
-                wedding_type=wedding_type,
-                food_menu=food_menu,
-                drinks=drinks,
-                pre_shoot_locations=pre_shoot_locations
-            )
-            db.session.add(food_location)
-        else:
-            # Just update fields
-            food_location.food_menu = food_menu
-            food_location.drinks = drinks
-            food_location.pre_shoot_locations = pre_shoot_locations
+        # Update in place; a key change is flushed as a single UPDATE of the
+        # primary key column
+        for key, value in fields.items():
+            setattr(food_location, key, value)
         
-        db.session.commit()
+        try:
+            _bump_list_version(FoodLocations)
+            db.session.commit()
+        except IntegrityError:
+            # Another request took the new key after the check above
+            db.session.rollback()
+            return jsonify({
+                'error': f'Food & locations for "{wedding_type}" already exists'
+            }), 409
+        theme_cache.invalidate()
         
         return jsonify({
             'message': 'Food & location updated successfully',
@@ -844,13 +1075,11 @@ def update_food_location():
         
     except Exception as e:
         db.session.rollback()
-        print(f"Error updating food location: {e}")
+        logger.exception("Error updating food location")
         return jsonify({'error': 'Failed to update food & location', 'details': str(e)}), 500
 
 
 @admin_data_bp.route('/food-locations', methods=['DELETE'])
-@login_required
-@_admin_required
 def delete_food_location():
     """Delete a food & location entry."""
     try:
@@ -859,18 +1088,22 @@ def delete_food_location():
         if not wedding_type:
             return jsonify({'error': 'wedding_type is required'}), 400
         
-        food_location = FoodLocations.query.filter_by(wedding_type=wedding_type).first_or_404()
+        result = db.session.execute(
+            delete(FoodLocations).where(FoodLocations.wedding_type == wedding_type)
+        )
+        if result.rowcount == 0:
+            db.session.rollback()
+            return jsonify({'error': 'Food & location not found'}), 404
         
-        db.session.delete(food_location)
+        _bump_list_version(FoodLocations)
         db.session.commit()
+        theme_cache.invalidate()
         
         return jsonify({'message': 'Food & location deleted successfully'}), 200
         
-    except NotFound:
-        return jsonify({'error': 'Food & location not found'}), 404
     except Exception as e:
         db.session.rollback()
-        print(f"Error deleting food location: {e}")
+        logger.exception("Error deleting food location")
         return jsonify({'error': 'Failed to delete food & location', 'details': str(e)}), 500
 
 
@@ -879,37 +1112,30 @@ def delete_food_location():
 # ============================================================================
 
 @admin_data_bp.route('/restricted-colours', methods=['GET'])
-@login_required
-@_admin_required
 def list_restricted_colours():
-    """Get all restricted colours, optionally filtered by wedding type."""
+    """
+    Get all restricted colours, optionally filtered by wedding type.
+    
+    With ``?grouped=true`` the list holds one entry per wedding type with
+    its colours, instead of one entry per (wedding type, colour) pair.
+    """
     try:
         wedding_type = request.args.get('wedding_type')
-        
-        query = RestrictedColours.query
-        if wedding_type:
-            query = query.filter_by(wedding_type=wedding_type)
-        
-        restricted_colours = query.order_by(
-            RestrictedColours.wedding_type,
-            RestrictedColours.restricted_colour
-        ).all()
-        
-        return jsonify({
-            'restricted_colours': [rc.to_dict() for rc in restricted_colours]
-        }), 200
+        if request.args.get('grouped', '').lower() == 'true':
+            build = _iter_restricted_colour_groups
+        else:
+            build = _iter_restricted_colours
+        return _conditional_list(RestrictedColours, 'restricted_colours', build, wedding_type)
     except Exception as e:
-        print(f"Error listing restricted colours: {e}")
+        logger.exception("Error listing restricted colours")
         return jsonify({'error': 'Failed to retrieve restricted colours', 'details': str(e)}), 500
 
 
 @admin_data_bp.route('/restricted-colours', methods=['POST'])
-@login_required
-@_admin_required
 def create_restricted_colour():
     """Create a new restricted colour."""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True)
         if not data:
             return jsonify({'error': 'Request body is required'}), 400
         
@@ -922,27 +1148,25 @@ def create_restricted_colour():
             return jsonify({'error': 'Restricted colour is required'}), 400
         
         # Check if wedding type exists
-        wedding_type_obj = WeddingType.query.filter_by(name=wedding_type).first()
-        if not wedding_type_obj:
+        if not _wedding_type_exists(wedding_type):
             return jsonify({'error': f'Wedding type "{wedding_type}" does not exist'}), 400
         
-        # Check for duplicates
-        existing = RestrictedColours.query.filter_by(
-            wedding_type=wedding_type,
-            restricted_colour=restricted_colour
-        ).first()
-        if existing:
-            return jsonify({
-                'error': f'Restricted colour "{restricted_colour}" for "{wedding_type}" already exists'
-            }), 409
-        
         restricted_colour_obj = RestrictedColours(
             wedding_type=wedding_type,
             restricted_colour=restricted_colour
         )
         
         db.session.add(restricted_colour_obj)
-        db.session.commit()
+        try:
+            _bump_list_version(RestrictedColours)
+            db.session.commit()
+        except IntegrityError:
+            # The primary key rejects duplicates; no SELECT beforehand
+            db.session.rollback()
+            return jsonify({
+                'error': f'Restricted colour "{restricted_colour}" for "{wedding_type}" already exists'
+            }), 409
+        theme_cache.invalidate()
         
         return jsonify({
             'message': 'Restricted colour created successfully',
@@ -951,13 +1175,11 @@ def create_restricted_colour():
         
     except Exception as e:
         db.session.rollback()
-        print(f"Error creating restricted colour: {e}")
+        logger.exception("Error creating restricted colour")
         return jsonify({'error': 'Failed to create restricted colour', 'details': str(e)}), 500
 
 
 @admin_data_bp.route('/restricted-colours', methods=['DELETE'])
-@login_required
-@_admin_required
 def delete_restricted_colour():
     """Delete a restricted colour (composite key requires both wedding_type and restricted_colour)."""
     try:
@@ -967,20 +1189,24 @@ def delete_restricted_colour():
         if not wedding_type or not restricted_colour:
             return jsonify({'error': 'Both wedding_type and restricted_colour are required'}), 400
         
-        restricted_colour_obj = RestrictedColours.query.filter_by(
-            wedding_type=wedding_type,
-            restricted_colour=restricted_colour
-        ).first_or_404()
+        result = db.session.execute(
+            delete(RestrictedColours).where(
+                RestrictedColours.wedding_type == wedding_type,
+                RestrictedColours.restricted_colour == restricted_colour
+            )
+        )
+        if result.rowcount == 0:
+            db.session.rollback()
+            return jsonify({'error': 'Restricted colour not found'}), 404
         
-        db.session.delete(restricted_colour_obj)
+        _bump_list_version(RestrictedColours)
         db.session.commit()
+        theme_cache.invalidate()
         
         return jsonify({'message': 'Restricted colour deleted successfully'}), 200
         
-    except NotFound:
-        return jsonify({'error': 'Restricted colour not found'}), 404
     except Exception as e:
         db.session.rollback()
-        print(f"Error deleting restricted colour: {e}")
+        logger.exception("Error deleting restricted colour")
         return jsonify({'error': 'Failed to delete restricted colour', 'details': str(e)}), 500
 
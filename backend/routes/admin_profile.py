@@ -5,32 +5,53 @@ Provides APIs for administrators to manage business and account details,
 including optional password updates.
 """
 
-from functools import wraps
+import logging
 import re
 
 from flask import Blueprint, jsonify, request
 from flask_login import current_user, login_required
+from sqlalchemy import exists, func, select
 from sqlalchemy.exc import OperationalError
 
 from extensions import db
-from models.user import User
+from models.user import ADMIN_FLAG, User
 from models.company import Company
+from services import company_cache
+
+logger = logging.getLogger(__name__)
 
 admin_profile_bp = Blueprint('admin_profile', __name__, url_prefix='/api/admin')
 
+# Validation patterns, compiled once at import
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9_]+$')
+_USERNAME_SCRUB_RE = re.compile(r'[^a-zA-Z0-9_]')
+
+# Page size for ?page= user lists, and the largest per_page accepted
+USERS_PER_PAGE = 50
+MAX_USERS_PER_PAGE = 200
+
+# Roles an admin can give to a managed user
+USER_ROLES = frozenset({'admin', 'planner', 'coordinator'})
+
+# Endpoints that do not need the admin role
+_NON_ADMIN_ENDPOINTS = frozenset({'admin_profile.get_company'})
 
-def _admin_required(fn):
-    """Decorator to ensure the current user is an authenticated admin."""
 
-    @wraps(fn)
-    def wrapper(*args, **kwargs):
-        if not current_user.is_authenticated:
-            return jsonify({'error': 'Login required'}), 401
-        if current_user.role != 'admin':
-            return jsonify({'error': 'Admin access required'}), 403
-        return fn(*args, **kwargs)
+@admin_profile_bp.before_request
+def _require_admin():
+    """Ensure admin profile requests come from an authenticated admin."""
+    # CORS preflight requests carry no credentials; the company details are
+    # readable by every logged-in user
+    if request.method == 'OPTIONS' or request.endpoint in _NON_ADMIN_ENDPOINTS:
+        return
 
-    return wrapper
+    # Resolve the LocalProxy once instead of on each attribute access
+    user = current_user._get_current_object()
+    if not user.is_authenticated:
+        return jsonify({'error': 'Login required'}), 401
+    if not (user.role_flags & ADMIN_FLAG):
+        return jsonify({'error': 'Admin access required'}), 403
 
 
 @admin_profile_bp.route('/company', methods=['GET'])
@@ -41,7 +62,7 @@ def get_company():
     Accessible to all logged-in users (admin and planner).
     """
     try:
-        company = Company.query.first()
+        company = company_cache.get()
         if not company:
             return jsonify({
                 'company': None,
@@ -50,15 +71,15 @@ def get_company():
         
         return jsonify({
             'company': {
-                'name': company.name,
-                'email': company.email,
-                'phone': company.phone,
-                'address': company.address,
-                'description': company.description
+                'name': company['name'],
+                'email': company['email'],
+                'phone': company['phone'],
+                'address': company['address'],
+                'description': company['description']
             }
         }), 200
-    except Exception as e:
-        print(f"Error fetching company details: {e}")
+    except Exception:
+        logger.exception("Error fetching company details")
         return jsonify({
             'company': None,
             'error': 'Failed to fetch company details'
@@ -66,16 +87,14 @@ def get_company():
 
 
 @admin_profile_bp.route('/profile', methods=['GET'])
-@login_required
-@_admin_required
 def get_admin_profile():
     """Return the admin's business and personal profile information."""
     user_dict = current_user.to_dict()
     try:
-        company = Company.query.first()
+        company = company_cache.get() or {}
     except OperationalError as exc:
-        print(f"Company table access failed: {exc}")
-        company = None
+        logger.warning("Company table access failed: %s", exc)
+        company = {}
     return jsonify({
         'admin': {
             'name': user_dict.get('name'),
@@ -85,11 +104,11 @@ def get_admin_profile():
             'address': user_dict.get('address'),
         },
         'company': {
-            'company_name': company.name if company else None,
-            'company_email': company.email if company else None,
-            'company_phone': company.phone if company else None,
-            'company_address': company.address if company else None,
-            'company_description': company.description if company else None,
+            'company_name': company.get('name'),
+            'company_email': company.get('email'),
+            'company_phone': company.get('phone'),
+            'company_address': company.get('address'),
+            'company_description': company.get('description'),
         },
         'metadata': {
             'updated_at': user_dict.get('updated_at'),
@@ -99,8 +118,6 @@ def get_admin_profile():
 
 
 @admin_profile_bp.route('/profile', methods=['PUT'])
-@login_required
-@_admin_required
 def update_admin_profile():
     """Update the admin business and personal profile."""
     data = request.get_json()
@@ -132,7 +149,9 @@ def update_admin_profile():
     if admin_email:
         # Check for duplicate email if changed
         if admin_email != current_user.email:
-            if User.query.filter(User.email == admin_email, User.id != current_user.id).first():
+            if db.session.execute(select(exists().where(
+                User.email == admin_email, User.id != current_user.id
+            ))).scalar():
                 return jsonify({'error': 'Email already in use'}), 409
         current_user.email = admin_email
 
@@ -141,18 +160,26 @@ def update_admin_profile():
         if new_username and new_username != current_user.username:
             if len(new_username) < 3:
                 return jsonify({'error': 'Username must be at least 3 characters long'}), 400
-            if not re.match(r'^[a-zA-Z0-9_]+$', new_username):
+            if not _USERNAME_RE.match(new_username):
                 return jsonify({'error': 'Username can only contain letters, numbers, and underscores'}), 400
-            if User.query.filter(User.username == new_username, User.id != current_user.id).first():
+            if db.session.execute(select(exists().where(
+                User.username == new_username, User.id != current_user.id
+            ))).scalar():
                 return jsonify({'error': 'Username already in use'}), 409
             current_user.username = new_username
 
+    # Checked before the company query below can autoflush the user. The
+    # duplicate checks above only query when a field is about to change,
+    # so a flush there still leaves a modification pending.
+    changed = db.session.is_modified(current_user._get_current_object())
+
     # Update company fields
+    company = None
     if any(key in company_data for key in ['company_name', 'company_email', 'company_phone', 'company_address', 'company_description']):
         try:
             company = Company.query.first()
         except OperationalError as exc:
-            print(f"Company table access failed: {exc}")
+            logger.warning("Company table access failed: %s", exc)
             company = None
 
         if company is None:
@@ -168,18 +195,26 @@ def update_admin_profile():
         company.phone = (company_data.get('company_phone') or '').strip() or None
         company.address = (company_data.get('company_address') or '').strip() or None
         company.description = (company_data.get('company_description') or '').strip() or None
+        changed = changed or company in db.session.new or db.session.is_modified(company)
 
     try:
-        db.session.commit()
-        company = Company.query.first()
-        profile = current_user.to_dict()
-        profile.update({
+        if company is None:
+            company = Company.query.first()
+        # Read the company fields before committing; the commit expires the
+        # instance and reading them afterwards would reload the row
+        company_fields = {
             'company_name': company.name if company else None,
             'company_email': company.email if company else None,
             'company_phone': company.phone if company else None,
             'company_address': company.address if company else None,
             'company_description': company.description if company else None,
-        })
+        }
+        # Re-submitted unchanged forms skip the commit and cache reload
+        if changed:
+            db.session.commit()
+            company_cache.invalidate()
+        profile = current_user.to_dict()
+        profile.update(company_fields)
         return jsonify({
             'message': 'Profile updated successfully',
             'profile': profile
@@ -190,8 +225,6 @@ def update_admin_profile():
 
 
 @admin_profile_bp.route('/profile/password', methods=['PUT'])
-@login_required
-@_admin_required
 def update_admin_password():
     """Allow admin to change their password."""
     data = request.get_json()
@@ -225,37 +258,94 @@ def update_admin_password():
 
 def _is_valid_email(email: str) -> bool:
     """Simple email validation."""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_RE.match(email) is not None
+
+
+def _validate_user_fields(name: str, email: str, role: str):
+    """
+    Validate the details of a managed user account.
+    
+    Returns:
+        str: Error message if validation fails, None if valid
+    """
+    if not name:
+        return 'Name is required'
+    if not email or not _is_valid_email(email):
+        return 'Valid email is required'
+    if role not in USER_ROLES:
+        return "Role must be either 'admin', 'planner', or 'coordinator'"
+    return None
+
+
+def _validate_new_password(password: str, confirm_password: str):
+    """
+    Validate a password set for a managed user account.
+    
+    Returns:
+        str: Error message if validation fails, None if valid
+    """
+    if len(password) < 6:
+        return 'Password must be at least 6 characters long'
+    if password != confirm_password:
+        return 'Password and confirm password do not match'
+    return None
 
 
 def _generate_username_from_email(email: str) -> str:
     """Generate a unique username based on the email prefix."""
     base = email.split('@')[0]
     # Keep alphanumeric and underscores, fallback to 'user'
-    base = re.sub(r'[^a-zA-Z0-9_]', '', base) or 'user'
+    base = _USERNAME_SCRUB_RE.sub('', base) or 'user'
     base = base[:20]
 
+    # Fetch every username sharing the prefix once instead of probing each
+    # candidate; compared lower-cased since MySQL matches usernames that way
+    taken = {
+        username.lower()
+        for username in db.session.execute(
+            select(User.username).where(User.username.startswith(base, autoescape=True))
+        ).scalars()
+    }
+
     candidate = base
     counter = 1
-    while User.query.filter_by(username=candidate).first():
+    while candidate.lower() in taken:
         candidate = f"{base}{counter}"
         counter += 1
     return candidate
 
 
 @admin_profile_bp.route('/users', methods=['GET'])
-@login_required
-@_admin_required
 def list_users():
-    """Return all users for management."""
-    users = User.query.order_by(User.created_at.desc()).all()
-    return jsonify({'users': [user.to_dict() for user in users]}), 200
+    """
+    Return users for management.
+    
+    All users are returned unless ``page`` or ``per_page`` is given, in
+    which case only that page is read and the response also carries the
+    total number of users.
+    """
+    if 'page' not in request.args and 'per_page' not in request.args:
+        return jsonify({'users': User.list_dicts()}), 200
+
+    page = request.args.get('page', 1, type=int)
+    per_page = request.args.get('per_page', USERS_PER_PAGE, type=int)
+    if page < 1:
+        return jsonify({'error': 'page must be a positive integer'}), 400
+    if per_page < 1:
+        return jsonify({'error': 'per_page must be a positive integer'}), 400
+    per_page = min(per_page, MAX_USERS_PER_PAGE)
+
+    total = db.session.execute(select(func.count(User.id))).scalar()
+    users = User.list_dicts(limit=per_page, offset=(page - 1) * per_page)
+    return jsonify({
+        'users': users,
+        'total': total,
+        'page': page,
+        'per_page': per_page
+    }), 200
 
 
 @admin_profile_bp.route('/users', methods=['POST'])
-@login_required
-@_admin_required
 def create_user():
     """Create a new user account."""
     data = request.get_json()
@@ -269,18 +359,11 @@ def create_user():
     password = data.get('password') or ''
     confirm_password = data.get('confirm_password') or ''
 
-    if not name:
-        return jsonify({'error': 'Name is required'}), 400
-    if not email or not _is_valid_email(email):
-        return jsonify({'error': 'Valid email is required'}), 400
-    if role not in ('admin', 'planner', 'coordinator'):
-        return jsonify({'error': "Role must be either 'admin', 'planner', or 'coordinator'"}), 400
-    if len(password) < 6:
-        return jsonify({'error': 'Password must be at least 6 characters long'}), 400
-    if password != confirm_password:
-        return jsonify({'error': 'Password and confirm password do not match'}), 400
+    error = _validate_user_fields(name, email, role) or _validate_new_password(password, confirm_password)
+    if error:
+        return jsonify({'error': error}), 400
 
-    if User.query.filter_by(email=email).first():
+    if db.session.execute(select(exists().where(User.email == email))).scalar():
         return jsonify({'error': 'Email already in use'}), 409
 
     username = _generate_username_from_email(email)
@@ -304,8 +387,6 @@ def create_user():
 
 
 @admin_profile_bp.route('/users/<int:user_id>', methods=['PUT'])
-@login_required
-@_admin_required
 def update_user(user_id):
     """Update user information."""
     user = User.query.get_or_404(user_id)
@@ -317,29 +398,26 @@ def update_user(user_id):
     email = (data.get('email') or '').strip().lower()
     phone_number = (data.get('phone_number') or '').strip() or None
     role = (data.get('role') or '').strip().lower()
+    new_password = data.get('password') or ''
+    confirm_password = data.get('confirm_password') or ''
 
-    if not name:
-        return jsonify({'error': 'Name is required'}), 400
-    if not email or not _is_valid_email(email):
-        return jsonify({'error': 'Valid email is required'}), 400
-    if role not in ('admin', 'planner', 'coordinator'):
-        return jsonify({'error': "Role must be either 'admin', 'planner', or 'coordinator'"}), 400
+    # The password is checked up front too, before any lookup or change
+    error = _validate_user_fields(name, email, role)
+    if not error and (new_password or confirm_password):
+        error = _validate_new_password(new_password, confirm_password)
+    if error:
+        return jsonify({'error': error}), 400
 
-    if email != user.email and User.query.filter(User.email == email, User.id != user_id).first():
+    if email != user.email and db.session.execute(select(exists().where(
+        User.email == email, User.id != user_id
+    ))).scalar():
         return jsonify({'error': 'Email already in use'}), 409
 
     user.name = name
     user.email = email
     user.phone_number = phone_number
     user.role = role
-
-    new_password = data.get('password') or ''
-    confirm_password = data.get('confirm_password') or ''
-    if new_password or confirm_password:
-        if len(new_password) < 6:
-            return jsonify({'error': 'Password must be at least 6 characters long'}), 400
-        if new_password != confirm_password:
-            return jsonify({'error': 'Password and confirm password do not match'}), 400
+    if new_password:
         user.set_password(new_password)
 
     try:
@@ -351,8 +429,6 @@ def update_user(user_id):
 
 
 @admin_profile_bp.route('/users/<int:user_id>', methods=['DELETE'])
-@login_required
-@_admin_required
 def delete_user(user_id):
     """Delete a user account."""
     if user_id == current_user.id:
@@ -9,21 +9,50 @@ This module handles user authentication including:
 - Password reset functionality
 """
 
+import logging
 import re
 from datetime import datetime, timedelta
 from flask import Blueprint, request, jsonify, current_app, url_for
 from flask_login import login_user, logout_user, login_required, current_user
 from flask_mail import Message
+from sqlalchemy import bindparam, exists, func, select
 
 from models.user import User
 from models.password_reset_token import PasswordResetToken
-from extensions import db, mail
+from extensions import db
+from services import mail_queue, rate_limit
+
+logger = logging.getLogger(__name__)
 
 # Create authentication blueprint
 auth_bp = Blueprint('auth', __name__, url_prefix='/auth')
 
+# Hot single-row lookups, built once so each request only binds parameters
+_USER_BY_EMAIL = select(User).where(User.email == bindparam('email'))
+_RESET_TOKEN_BY_HASH = select(PasswordResetToken).where(
+    PasswordResetToken.token_hash == bindparam('token_hash')
+)
+# The user with the counts forgot_password needs: tokens issued since
+# :cutoff (rate limit) and unused tokens (to invalidate)
+_RESET_REQUEST_BY_EMAIL = select(
+    User,
+    select(func.count()).where(
+        PasswordResetToken.user_id == User.id,
+        PasswordResetToken.created_at >= bindparam('cutoff')
+    ).scalar_subquery(),
+    select(func.count()).where(
+        PasswordResetToken.user_id == User.id,
+        PasswordResetToken.used == False
+    ).scalar_subquery()
+).where(User.email == bindparam('email'))
+
+# Validation patterns, compiled once at import
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9_]+$')
+
 
 @auth_bp.route('/login', methods=['POST'])
+@rate_limit.limit('LOGIN_RATE_LIMIT_PER_MINUTE', 60)
 def login():
     """
     User login endpoint.
@@ -55,7 +84,7 @@ def login():
             return jsonify({"error": "Invalid email format"}), 400
 
         # Authenticate user
-        user = User.query.filter_by(email=email).first()
+        user = db.session.execute(_USER_BY_EMAIL, {'email': email}).scalar()
         
         if not user:
             return jsonify({"error": "Invalid email or password"}), 401
@@ -63,6 +92,11 @@ def login():
         if not user.check_password(password):
             return jsonify({"error": "Invalid email or password"}), 401
 
+        # Upgrade legacy password hashes while the plain password is at hand
+        if user.password_needs_rehash():
+            user.set_password(password)
+            db.session.commit()
+
         # Login successful
         login_user(user, remember=True)
         
@@ -114,11 +148,18 @@ def register():
         if validation_error:
             return jsonify({"error": validation_error}), 400
 
-        # Check for existing users
-        if User.query.filter_by(email=email).first():
+        # Check for existing users; both unique indexes are probed in one
+        # round trip
+        email_taken, username_taken = db.session.execute(
+            select(
+                exists().where(User.email == email),
+                exists().where(User.username == username)
+            )
+        ).one()
+        if email_taken:
             return jsonify({"error": "Email already registered"}), 409
 
-        if User.query.filter_by(username=username).first():
+        if username_taken:
             return jsonify({"error": "Username already taken"}), 409
 
         # Create new user
@@ -261,9 +302,7 @@ def _is_valid_email(email):
     Returns:
         bool: True if valid email format, False otherwise
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-
-    return re.match(pattern, email) is not None
+    return _EMAIL_RE.match(email) is not None
 
 
 def _validate_registration_data(email, username, password, role):
@@ -287,7 +326,7 @@ def _validate_registration_data(email, username, password, role):
     if len(username) < 3:
         return "Username must be at least 3 characters long"
     
-    if not re.match(r'^[a-zA-Z0-9_]+$', username):
+    if not _USERNAME_RE.match(username):
         return "Username can only contain letters, numbers, and underscores"
     
     # Password validation
@@ -301,6 +340,7 @@ def _validate_registration_data(email, username, password, role):
     return None
 
 @auth_bp.route('/forgot-password', methods=['POST'])
+@rate_limit.limit('PASSWORD_RESET_IP_RATE_LIMIT_PER_HOUR', 3600)
 def forgot_password():
     """
     Request password reset via email.
@@ -327,8 +367,11 @@ def forgot_password():
         if not _is_valid_email(email):
             return jsonify({"error": "Invalid email format"}), 400
 
-        # Find user by email
-        user = User.query.filter_by(email=email).first()
+        # Find user by email, with their recent and unused token counts
+        one_hour_ago = datetime.utcnow() - timedelta(hours=1)
+        row = db.session.execute(
+            _RESET_REQUEST_BY_EMAIL, {'email': email, 'cutoff': one_hour_ago}
+        ).first()
 
         # Always return success message to prevent email enumeration
         # Don't reveal whether email exists or not
@@ -336,42 +379,38 @@ def forgot_password():
             "message": "If an account exists with this email, a password reset link has been sent."
         }
 
-        if user:
-            # Check rate limiting (max 3 requests per hour per email)
-            one_hour_ago = datetime.utcnow() - timedelta(hours=1)
-            recent_requests = PasswordResetToken.query.filter(
-                PasswordResetToken.user_id == user.id,
-                PasswordResetToken.created_at >= one_hour_ago
-            ).count()
+        if row:
+            user, recent_requests, unused_tokens = row
 
+            # Check rate limiting (max 3 requests per hour per email)
             if recent_requests >= current_app.config.get('PASSWORD_RESET_RATE_LIMIT_PER_HOUR', 3):
                 # Rate limit exceeded, but still return success message
                 return jsonify(success_message), 200
 
             # Invalidate any existing unused tokens for this user
-            PasswordResetToken.query.filter(
-                PasswordResetToken.user_id == user.id,
-                PasswordResetToken.used == False
-            ).delete()
+            if unused_tokens:
+                PasswordResetToken.query.filter(
+                    PasswordResetToken.user_id == user.id,
+                    PasswordResetToken.used == False
+                ).delete()
 
             # Create new reset token
             expiration_hours = current_app.config.get('PASSWORD_RESET_TOKEN_EXPIRATION_HOURS', 1)
-            reset_token = PasswordResetToken.create_token(user.id, expiration_hours)
-            db.session.add(reset_token)
+            token = PasswordResetToken.issue_token(user.id, expiration_hours)
             db.session.commit()
 
-            # Send password reset email
+            # Queue the password reset email; delivery happens off the request
             try:
-                _send_password_reset_email(user, reset_token.token)
-            except Exception as email_error:
+                _send_password_reset_email(user, token)
+            except Exception:
                 # Log error but don't reveal it to user
-                print(f"Error sending password reset email: {email_error}")
+                logger.exception("Error sending password reset email")
                 # Still return success to prevent email enumeration
 
         return jsonify(success_message), 200
 
-    except Exception as e:
-        print(f"Error in forgot_password: {e}")
+    except Exception:
+        logger.exception("Error in forgot_password")
         return jsonify({
             "message": "If an account exists with this email, a password reset link has been sent."
         }), 200
@@ -417,7 +456,9 @@ def reset_password():
             return jsonify({"error": "Password must be at least 6 characters long"}), 400
 
         # Find token
-        reset_token = PasswordResetToken.query.filter_by(token=token).first()
+        reset_token = db.session.execute(
+            _RESET_TOKEN_BY_HASH, {'token_hash': PasswordResetToken.hash_token(token)}
+        ).scalar()
 
         if not reset_token:
             return jsonify({"error": "Invalid or expired reset token"}), 400
@@ -444,9 +485,9 @@ def reset_password():
             "message": "Password reset successful. You can now log in with your new password."
         }), 200
 
-    except Exception as e:
+    except Exception:
         db.session.rollback()
-        print(f"Error in reset_password: {e}")
+        logger.exception("Error in reset_password")
         return jsonify({"error": "Failed to reset password. Please try again."}), 500
 
 
@@ -467,7 +508,9 @@ def verify_reset_token():
         if not token:
             return jsonify({"error": "Token is required"}), 400
 
-        reset_token = PasswordResetToken.query.filter_by(token=token).first()
+        reset_token = db.session.execute(
+            _RESET_TOKEN_BY_HASH, {'token_hash': PasswordResetToken.hash_token(token)}
+        ).scalar()
 
         if not reset_token:
             return jsonify({
@@ -486,14 +529,14 @@ def verify_reset_token():
             "message": "Token is valid"
         }), 200
 
-    except Exception as e:
-        print(f"Error in verify_reset_token: {e}")
+    except Exception:
+        logger.exception("Error in verify_reset_token")
         return jsonify({"error": "Failed to verify token"}), 500
 
 
 def _send_password_reset_email(user, token):
     """
-    Send password reset email to user.
+    Build the password reset email and queue it for delivery.
     
     Args:
         user (User): User object
@@ -557,10 +600,9 @@ def _send_password_reset_email(user, token):
             body=text_body
         )
 
-        mail.send(msg)
-        print(f"Password reset email sent to {user.email}")
+        mail_queue.send(msg)
 
-    except Exception as e:
-        print(f"Error sending password reset email: {e}")
+    except Exception:
+        logger.exception("Error queueing password reset email")
         raise
 
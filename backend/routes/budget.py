@@ -7,6 +7,8 @@ from decimal import Decimal, InvalidOperation
 
 from flask import Blueprint, jsonify, request
 from flask_login import login_required, current_user
+from sqlalchemy import exists, select
+from sqlalchemy.orm import joinedload
 
 from extensions import db
 from models.project import Project
@@ -25,10 +27,10 @@ def _user_can_access_project(project: Project) -> bool:
     if current_user.is_coordinator():
         # Coordinators are not assigned to projects directly; they only see projects with tasks assigned to them
         from models.checklist_task import ChecklistTask
-        has_assigned_tasks = ChecklistTask.query.filter_by(
-            project_id=project.id,
-            assigned_to=current_user.id
-        ).first() is not None
+        has_assigned_tasks = db.session.execute(select(exists().where(
+            ChecklistTask.project_id == project.id,
+            ChecklistTask.assigned_to == current_user.id
+        ))).scalar()
         return has_assigned_tasks
     # Planners can access projects they are assigned to or created
     return project.created_by == current_user.id or project.assigned_to == current_user.id
@@ -142,7 +144,7 @@ def create_budget_item(project_id):
 @login_required
 def update_budget_item(item_id):
     """Update an existing budget item."""
-    item = BudgetItem.query.get_or_404(item_id)
+    item = BudgetItem.query.options(joinedload(BudgetItem.project)).get_or_404(item_id)
     if not _user_can_access_project(item.project):
         return jsonify({'error': 'Access denied'}), 403
     
@@ -200,7 +202,7 @@ def update_budget_item(item_id):
 @login_required
 def delete_budget_item(item_id):
     """Delete a budget item."""
-    item = BudgetItem.query.get_or_404(item_id)
+    item = BudgetItem.query.options(joinedload(BudgetItem.project)).get_or_404(item_id)
     if not _user_can_access_project(item.project):
         return jsonify({'error': 'Access denied'}), 403
     
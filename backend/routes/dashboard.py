@@ -6,6 +6,7 @@ This module provides API endpoints for dashboard statistics including:
 - Role-based access control for statistics
 """
 
+import logging
 from flask import Blueprint, jsonify
 from flask_login import login_required, current_user
 from datetime import datetime, date, timedelta
@@ -16,6 +17,8 @@ from models.checklist_task import ChecklistTask
 from models.budget_item import BudgetItem
 from extensions import db
 
+logger = logging.getLogger(__name__)
+
 # Create blueprint for dashboard routes
 dashboard_bp = Blueprint('dashboard', __name__, url_prefix='/api/dashboard')
 
@@ -93,9 +96,9 @@ def get_dashboard_stats():
                 task_query = task_query.filter_by(assigned_to=current_user.id)
             pending_tasks_count = task_query.count()
             stats['pending_tasks'] = pending_tasks_count
-        except Exception as e:
+        except Exception:
             # Table might not exist, return 0
-            print(f"Error counting pending tasks: {e}")
+            logger.exception("Error counting pending tasks")
             stats['pending_tasks'] = 0
         
         # 2. Calculate Total Budget
@@ -107,9 +110,9 @@ def get_dashboard_stats():
                 .scalar()
             )
             stats['total_budget'] = float(total_budget_result) if total_budget_result else 0.0
-        except Exception as e:
+        except Exception:
             # Table might not exist, return 0
-            print(f"Error calculating total budget: {e}")
+            logger.exception("Error calculating total budget")
             stats['total_budget'] = 0.0
         
         # 3. Calculate Active Clients Count
@@ -122,8 +125,8 @@ def get_dashboard_stats():
                 .count()
             )
             stats['active_clients'] = active_clients_count
-        except Exception as e:
-            print(f"Error counting active clients: {e}")
+        except Exception:
+            logger.exception("Error counting active clients")
             stats['active_clients'] = 0
         
         # 4. Upcoming Events (Placeholder - calendar events not implemented yet)
@@ -152,8 +155,8 @@ def get_dashboard_stats():
                 }
                 for project in ongoing_projects
             ]
-        except Exception as e:
-            print(f"Error fetching ongoing projects: {e}")
+        except Exception:
+            logger.exception("Error fetching ongoing projects")
             stats['ongoing_projects'] = []
         
         return jsonify({
@@ -162,9 +165,7 @@ def get_dashboard_stats():
         }), 200
         
     except Exception as e:
-        import traceback
-        print(f"Error in get_dashboard_stats: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error in get_dashboard_stats")
         return jsonify({
             'error': 'Failed to retrieve dashboard statistics',
             'message': str(e),
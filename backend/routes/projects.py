@@ -8,8 +8,10 @@ This module provides API endpoints for managing wedding projects including:
 - Integration with theme suggestions
 """
 
+import logging
 from flask import Blueprint, request, jsonify
 from flask_login import login_required, current_user
+from sqlalchemy import exists, select
 from datetime import datetime, date
 
 from models.project import Project
@@ -18,6 +20,8 @@ from models.theme_suggestion import ThemeSuggestion
 from models.checklist_task import ChecklistTask
 from extensions import db
 
+logger = logging.getLogger(__name__)
+
 # Create blueprint for project routes
 projects_bp = Blueprint('projects', __name__, url_prefix='/api/projects')
 
@@ -32,10 +36,10 @@ def _user_can_access_project(project):
         return True
     if current_user.is_coordinator():
         # Coordinators are not assigned to projects directly; they only see projects with tasks assigned to them
-        has_assigned_tasks = ChecklistTask.query.filter_by(
-            project_id=project.id,
-            assigned_to=current_user.id
-        ).first() is not None
+        has_assigned_tasks = db.session.execute(select(exists().where(
+            ChecklistTask.project_id == project.id,
+            ChecklistTask.assigned_to == current_user.id
+        ))).scalar()
         return has_assigned_tasks
     # Planners can access projects they are assigned to or created
     return project.assigned_to == current_user.id or project.created_by == current_user.id
@@ -148,12 +152,12 @@ def get_projects_for_theme_suggestions():
         JSON: List of projects formatted for theme suggestions
     """
     try:
-        print(f"Getting projects for user: {current_user.id}, Role: {current_user.role}")
+        logger.debug("Getting projects for user: %s, Role: %s", current_user.id, current_user.role)
         
         # Get projects accessible to current user
         if current_user.is_admin():
             projects = Project.query.order_by(Project.created_at.desc()).all()
-            print(f"Admin user - Found {len(projects)} total projects")
+            logger.debug("Admin user - Found %d total projects", len(projects))
         elif current_user.is_coordinator():
             # Coordinators are not assigned to projects directly; they only see projects with tasks assigned to them
             project_ids_with_tasks = db.session.query(ChecklistTask.project_id).filter_by(
@@ -162,30 +166,28 @@ def get_projects_for_theme_suggestions():
             projects = Project.query.filter(
                 Project.id.in_(db.session.query(project_ids_with_tasks))
             ).order_by(Project.created_at.desc()).all()
-            print(f"Coordinator user - Found {len(projects)} projects with assigned tasks (coordinator: {current_user.id})")
+            logger.debug("Coordinator user - Found %d projects with assigned tasks (coordinator: %s)", len(projects), current_user.id)
         else:
             # Planners can see projects they are assigned to or created
             projects = Project.query.filter(
                 (Project.assigned_to == current_user.id) | 
                 (Project.created_by == current_user.id)
             ).order_by(Project.created_at.desc()).all()
-            print(f"Planner user - Found {len(projects)} projects (assigned: {current_user.id}, created: {current_user.id})")
+            logger.debug("Planner user - Found %d projects (assigned: %s, created: %s)", len(projects), current_user.id, current_user.id)
         
         # Convert projects to dictionary format
         projects_list = [project.to_theme_dict() for project in projects]
         
-        print(f"Returning {len(projects_list)} projects")
+        logger.debug("Returning %d projects", len(projects_list))
         for i, proj in enumerate(projects_list[:3]):  # Log first 3 projects
-            print(f"Project {i+1}: ID={proj.get('id')}, Bride={proj.get('bride_name')}, Groom={proj.get('groom_name')}")
+            logger.debug("Project %d: ID=%s, Bride=%s, Groom=%s", i + 1, proj.get('id'), proj.get('bride_name'), proj.get('groom_name'))
         
         return jsonify({
             'projects': projects_list
         }), 200
         
     except Exception as e:
-        import traceback
-        print(f"Error in get_projects_for_theme_suggestions: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error in get_projects_for_theme_suggestions")
         return jsonify({
             'error': 'Failed to retrieve projects for theme suggestions',
             'message': str(e)
@@ -272,7 +274,9 @@ def create_project():
             return jsonify({'error': 'Invalid wedding date format. Use YYYY-MM-DD'}), 400
         
         # Check for duplicate contact email
-        existing_project = Project.query.filter_by(contact_email=data['contact_email']).first()
+        existing_project = db.session.execute(select(exists().where(
+            Project.contact_email == data['contact_email']
+        ))).scalar()
         if existing_project:
             return jsonify({'error': 'A project with this email already exists'}), 409
         
@@ -508,44 +512,16 @@ def list_project_tasks(project_id):
             return jsonify({'error': 'Access denied to this project'}), 403
 
         try:
-            # Use joinedload to eagerly load relationships and avoid N+1 queries
-            from sqlalchemy.orm import joinedload
-            base_query = (
-                ChecklistTask.query
-                .options(joinedload(ChecklistTask.assignee))
-                .options(joinedload(ChecklistTask.creator))
-                .filter_by(project_id=project_id)
-            )
-            
+            # Plain rows with the cached assignee fields; no ORM objects are built.
             # Coordinators can only see tasks assigned to them
-            if current_user.is_coordinator():
-                # MySQL doesn't support NULLS LAST in ORDER BY; order by fields directly
-                tasks = (
-                    base_query.filter_by(assigned_to=current_user.id)
-                    .order_by(
-                        ChecklistTask.due_date.asc(),
-                        ChecklistTask.status.asc(),
-                        ChecklistTask.created_at.asc(),
-                    )
-                    .all()
-                )
-            else:
-                # Admin and Planner can see all tasks in the project
-                tasks = (
-                    base_query.order_by(
-                        ChecklistTask.due_date.asc(),
-                        ChecklistTask.status.asc(),
-                        ChecklistTask.created_at.asc(),
-                    ).all()
-                )
+            tasks_data = ChecklistTask.list_dicts_for_project(
+                project_id,
+                assigned_to=current_user.id if current_user.is_coordinator() else None,
+            )
         except Exception as db_error:
             # Database error - table might not exist or schema mismatch
-            import traceback
-            error_trace = traceback.format_exc()
             error_msg = str(db_error)
-            print(f"Database error retrieving tasks for project {project_id}:")
-            print(f"Error: {error_msg}")
-            print(f"Traceback:\n{error_trace}")
+            logger.exception("Database error retrieving tasks for project %s", project_id)
             
             # Check if it's a table doesn't exist error
             if 'doesn\'t exist' in error_msg.lower() or 'no such table' in error_msg.lower() or 'table' in error_msg.lower() and 'not found' in error_msg.lower():
@@ -560,54 +536,25 @@ def list_project_tasks(project_id):
                 'detail': 'Please check the backend console for more details.'
             }), 500
 
+        statuses = [task['status'] for task in tasks_data]
         summary = {
-            'total': len(tasks),
-            'completed': sum(1 for task in tasks if task.status == 'completed'),
-            'in_progress': sum(1 for task in tasks if task.status == 'in_progress'),
-            'pending': sum(1 for task in tasks if task.status == 'pending'),
+            'total': len(statuses),
+            'completed': statuses.count('completed'),
+            'in_progress': statuses.count('in_progress'),
+            'pending': statuses.count('pending'),
         }
         summary['completion_rate'] = (
             round((summary['completed'] / summary['total']) * 100, 2)
             if summary['total'] else 0.0
         )
 
-        # Serialize tasks with error handling
-        tasks_data = []
-        for task in tasks:
-            try:
-                tasks_data.append(task.to_dict())
-            except Exception as serialization_error:
-                import traceback
-                print(f"Error serializing task {task.id}: {serialization_error}")
-                print(traceback.format_exc())
-                # Include task with minimal data if serialization fails
-                tasks_data.append({
-                    'id': task.id,
-                    'project_id': task.project_id,
-                    'title': getattr(task, 'title', 'Unknown Task'),
-                    'description': None,
-                    'status': getattr(task, 'status', 'pending'),
-                    'due_date': None,
-                    'assigned_to': getattr(task, 'assigned_to', None),
-                    'assigned_to_name': None,
-                    'assigned_to_email': None,
-                    'created_by': getattr(task, 'created_by', None),
-                    'created_at': None,
-                    'updated_at': None,
-                })
-
         return jsonify({
             'tasks': tasks_data,
             'summary': summary
         }), 200
 
     except Exception as exc:
-        import traceback
-        error_trace = traceback.format_exc()
-        error_msg = str(exc)
-        print(f"Error retrieving checklist tasks for project {project_id}:")
-        print(f"Error: {error_msg}")
-        print(f"Traceback:\n{error_trace}")
+        logger.exception("Error retrieving checklist tasks for project %s", project_id)
         return jsonify({
             'error': 'Failed to retrieve checklist tasks',
             'message': str(exc)
@@ -663,20 +610,15 @@ def create_project_task(project_id):
             description=description,
             status=status,
             due_date=due_date,
-            assigned_to=assigned_user.id if assigned_user else None,
             created_by=current_user.id
         )
+        task.assign_to(assigned_user)
 
         db.session.add(task)
         db.session.commit()
         
-        # Refresh to load relationships
+        # Reload the committed row (including the cached assignee fields)
         db.session.refresh(task)
-        from sqlalchemy.orm import joinedload
-        task = ChecklistTask.query.options(
-            joinedload(ChecklistTask.assignee),
-            joinedload(ChecklistTask.creator)
-        ).get(task.id)
 
         return jsonify({
             'message': 'Task created successfully',
@@ -748,7 +690,7 @@ def update_project_task(project_id, task_id):
         if 'assigned_to' in data:
             assigned_to_raw = data.get('assigned_to')
             if assigned_to_raw in (None, '', 'null'):
-                task.assigned_to = None
+                task.assign_to(None)
             else:
                 try:
                     assigned_id = int(assigned_to_raw)
@@ -762,17 +704,12 @@ def update_project_task(project_id, task_id):
                 # Planners can assign tasks to themselves or coordinators
                 if current_user.is_planner() and assigned_user.id != current_user.id and assigned_user.role != 'coordinator':
                     return jsonify({'error': 'Planners can only assign tasks to themselves or coordinators'}), 403
-                task.assigned_to = assigned_user.id
+                task.assign_to(assigned_user)
 
         db.session.commit()
         
-        # Refresh to load relationships
+        # Reload the committed row (including the cached assignee fields)
         db.session.refresh(task)
-        from sqlalchemy.orm import joinedload
-        task = ChecklistTask.query.options(
-            joinedload(ChecklistTask.assignee),
-            joinedload(ChecklistTask.creator)
-        ).get(task.id)
         
         return jsonify({
             'message': 'Task updated successfully',
@@ -8,6 +8,7 @@ a decision tree algorithm with database-driven rules including:
 - Decision tree management
 """
 
+import logging
 from flask import Blueprint, request, jsonify
 
 from services.wedding_service import (
@@ -22,6 +23,8 @@ from services.decision_tree_service import (
     rebuild_decision_tree
 )
 
+logger = logging.getLogger(__name__)
+
 # Create blueprint for wedding planning routes
 wedding_bp = Blueprint('wedding', __name__, url_prefix='/api/wedding')
 
@@ -161,6 +164,7 @@ def get_wedding_types():
         # Get wedding types from wedding_types table with details
         from models.wedding_planning import WeddingType, RestrictedColours
         from extensions import db
+        from sqlalchemy import exists, select
         from services.wedding_service import get_wedding_type_details
         
         # Enhance wedding types with additional information
@@ -178,9 +182,9 @@ def get_wedding_types():
                 
                 # Check if this wedding type has restrictions
                 # Query the restricted_colours table to see if this wedding type has any restrictions
-                has_restrictions = RestrictedColours.query.filter(
+                has_restrictions = db.session.execute(select(exists().where(
                     db.func.lower(RestrictedColours.wedding_type) == wt_name.lower()
-                ).first() is not None
+                ))).scalar()
                 
                 enhanced_types.append({
                     'name': wt_name,
@@ -188,8 +192,8 @@ def get_wedding_types():
                     'available_colors': color_count,
                     'has_restrictions': has_restrictions
                 })
-            except Exception as e:
-                print(f"Error enhancing wedding type {wt_name}: {e}")
+            except Exception:
+                logger.exception("Error enhancing wedding type %s", wt_name)
                 # If there's an error with a specific wedding type, add it without enhancement
                 enhanced_types.append({
                     'name': wt_name,
@@ -204,7 +208,7 @@ def get_wedding_types():
         }), 200
         
     except Exception as e:
-        print(f"Error in get_wedding_types: {e}")
+        logger.exception("Error in get_wedding_types")
         return jsonify({
             'error': 'Failed to retrieve wedding types',
             'message': str(e),
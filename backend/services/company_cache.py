@@ -0,0 +1,47 @@
+"""
+In-process cache of the company details.
+
+The single company row only changes through the admin profile update, yet
+the company and admin profile endpoints read it on every request. Each
+worker keeps the details in ``reference_cache`` for ``REFERENCE_CACHE_TTL``
+seconds, like ``theme_cache``; the worker that handles the update drops
+them straight away through ``invalidate()``.
+"""
+
+from typing import Dict, Optional
+
+from sqlalchemy import select
+
+from extensions import db
+from models.company import Company
+from services import reference_cache
+
+
+def _load() -> Optional[Dict]:
+    """Read the company details, or None when no company is set up."""
+    row = db.session.execute(
+        select(
+            Company.name,
+            Company.email,
+            Company.phone,
+            Company.address,
+            Company.description
+        ).order_by(Company.id).limit(1)
+    ).first()
+    return row._asdict() if row else None
+
+
+def get() -> Optional[Dict]:
+    """
+    Return the company details, loading them when missing or expired.
+
+    Returns:
+        Optional[Dict]: name, email, phone, address and description of the
+        company, or None when no company is set up
+    """
+    return reference_cache.get('company', _load)
+
+
+def invalidate():
+    """Drop the cached company details so the next read loads the row again."""
+    reference_cache.invalidate('company')
@@ -4,14 +4,17 @@ Uses decision tree algorithm to make wedding planning suggestions based on datab
 Enhanced with caching and performance optimizations.
 """
 
+import logging
 import math
+import threading
 import time
 from typing import Dict, List, Tuple, Optional, Any
-from models.wedding_planning import CulturalColors, ColorRules, FoodLocations, ColorMappings
-from extensions import db
+from models.wedding_planning import CulturalColors, ColorRules, FoodLocations
 from dataclasses import dataclass
 from collections import Counter
-from functools import lru_cache
+from services import theme_cache
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -38,30 +41,18 @@ class WeddingDecisionTree:
         self.root = None
         self.last_build_time = None
         self.build_duration = 0
-        self._color_mappings_cache = None
         self._training_data_cache = None
     
-    @lru_cache(maxsize=1)
     def _load_color_mappings_from_database(self) -> Dict[str, str]:
-        """Load color name to RGB mappings from database with caching."""
-        if self._color_mappings_cache is not None:
-            return self._color_mappings_cache
-            
-        color_mappings = {}
-        mappings = ColorMappings.query.all()
-        
-        for mapping in mappings:
-            color_mappings[mapping.color_name] = mapping.rgb
-        
-        self._color_mappings_cache = color_mappings
-        return color_mappings
+        """Return color name to RGB mappings from the cached reference data."""
+        return theme_cache.get()['mappings']
     
     def build_tree_from_database(self):
         """
         Build decision tree from database rules with performance tracking.
         Uses wedding planning data to create decision nodes.
         """
-        print("[INFO] Building decision tree from database...")
+        logger.info("Building decision tree from database...")
         start_time = time.time()
         
         # Load all data from database
@@ -79,8 +70,8 @@ class WeddingDecisionTree:
         self.build_duration = end_time - start_time
         self.last_build_time = time.time()
         
-        print(f"[SUCCESS] Decision tree built successfully in {self.build_duration:.3f} seconds!")
-        print(f"[INFO] Training data points: {len(training_data)}")
+        logger.info("Decision tree built in %.3f seconds from %d training data points",
+                    self.build_duration, len(training_data))
         return self.root
     
     def _prepare_training_data(self, cultural_colors, color_rules, food_locations) -> List[Dict]:
@@ -356,10 +347,9 @@ class WeddingDecisionTree:
             # Import here to avoid circular dependencies at module load time
             from services.wedding_service import get_enhanced_color_details
 
-            color_rule = ColorRules.query.filter(
-                db.func.lower(ColorRules.wedding_type) == normalized_wedding_type.lower().strip(),
-                db.func.lower(ColorRules.bride_colour) == mapped_bride_colour.lower().strip()
-            ).first()
+            color_rule = theme_cache.get()['rules_ci'].get(
+                (normalized_wedding_type.lower().strip(), mapped_bride_colour.lower().strip())
+            )
 
             if color_rule:
                 prediction['color_details'] = get_enhanced_color_details(normalized_wedding_type, color_rule)
@@ -377,30 +367,27 @@ class WeddingDecisionTree:
             str: Normalized wedding type that exists in database
         """
         wedding_type = wedding_type.strip()
+        reference = theme_cache.get()
         
         # Try exact match first
-        if CulturalColors.query.filter_by(wedding_type=wedding_type).first():
+        if wedding_type in reference['cultural']:
             return wedding_type
         
         # Try case-insensitive match
-        exact_match = CulturalColors.query.filter(
-            db.func.lower(CulturalColors.wedding_type) == wedding_type.lower()
-        ).first()
+        exact_match = reference['cultural_ci'].get(wedding_type.lower())
         
         if exact_match:
-            return exact_match.wedding_type
+            return exact_match[0].wedding_type
         
         # Try partial match (e.g., "Tamil Wedding" -> "Tamil Hindu Wedding")
         # Split input into words and try to find best match
         input_words = set(wedding_type.lower().split())
-        all_types = db.session.query(CulturalColors.wedding_type).distinct().all()
         
         best_match = None
         best_score = 0
         matches = []  # Store all matches with scores
         
-        for wt_tuple in all_types:
-            wt_db = wt_tuple[0]
+        for wt_db in reference['wedding_types']:
             db_words = set(wt_db.lower().split())
             
             # Calculate match score (number of common words)
@@ -431,7 +418,7 @@ class WeddingDecisionTree:
                 best_match = None
                 max_rules = 0
                 for wt, score in matches_with_scores:
-                    rule_count = ColorRules.query.filter_by(wedding_type=wt).count()
+                    rule_count = reference['rule_counts'].get(wt, 0)
                     if rule_count > max_rules:
                         max_rules = rule_count
                         best_match = wt
@@ -445,8 +432,8 @@ class WeddingDecisionTree:
     
     def _get_database_fallback(self, wedding_type: str, bride_colour: str) -> Dict:
         """
-        Get prediction directly from database when tree traversal fails.
-        This is the fallback mechanism that queries the database directly.
+        Get prediction directly from the reference data when tree traversal fails.
+        This is the fallback mechanism that looks the rules up directly.
         
         Args:
             wedding_type: Wedding type (should be normalized)
@@ -455,18 +442,17 @@ class WeddingDecisionTree:
         Returns:
             Dict: Prediction from database or empty dict
         """
+        reference = theme_cache.get()
+
         # Try exact match first (case-insensitive for both wedding type and color)
-        color_rule = ColorRules.query.filter(
-            db.func.lower(ColorRules.wedding_type) == wedding_type.lower().strip(),
-            db.func.lower(ColorRules.bride_colour) == bride_colour.lower().strip()
-        ).first()
+        color_rule = reference['rules_ci'].get(
+            (wedding_type.lower().strip(), bride_colour.lower().strip())
+        )
         
         # If exact match not found, search all rules for this wedding type
         if not color_rule:
             # Get all rules for this wedding type
-            color_rules = ColorRules.query.filter(
-                db.func.lower(ColorRules.wedding_type) == wedding_type.lower().strip()
-            ).all()
+            color_rules = reference['rules_by_type_ci'].get(wedding_type.lower().strip())
             
             if color_rules:
                 # Try to find rule with matching color name (case-insensitive)
@@ -480,10 +466,9 @@ class WeddingDecisionTree:
                 # Instead, we need to verify the color exists in CulturalColors for this wedding type
                 if not color_rule:
                     # Check if the mapped color actually exists for this wedding type
-                    cultural_color = CulturalColors.query.filter(
-                        db.func.lower(CulturalColors.wedding_type) == wedding_type.lower().strip(),
-                        db.func.lower(CulturalColors.colour_name) == bride_colour.lower().strip()
-                    ).first()
+                    cultural_color = reference['cultural_color_ci'].get(
+                        (wedding_type.lower().strip(), bride_colour.lower().strip())
+                    )
                     
                     if cultural_color:
                         # Color exists but no rule found - this is a data issue
@@ -504,19 +489,14 @@ class WeddingDecisionTree:
             return {}
         
         # Get food/location data (case-insensitive)
-        food_data = FoodLocations.query.filter(
-            db.func.lower(FoodLocations.wedding_type) == wedding_type.lower().strip()
-        ).first()
+        food_data = reference['food_ci'].get(wedding_type.lower().strip())
         
         # If no exact match, try similar wedding type
         if not food_data:
-            all_food_types = db.session.query(FoodLocations.wedding_type).distinct().all()
-            for ft_tuple in all_food_types:
-                ft_db = ft_tuple[0]
+            for ft_db in reference['food_types']:
                 if wedding_type.lower().strip() in ft_db.lower() or ft_db.lower() in wedding_type.lower().strip():
-                    food_data = FoodLocations.query.filter_by(wedding_type=ft_db).first()
-                    if food_data:
-                        break
+                    food_data = reference['food'][ft_db]
+                    break
         
         prediction = {
             'bride_colour_mapped': color_rule.bride_colour,
@@ -557,25 +537,18 @@ class WeddingDecisionTree:
         normalized_type = wedding_type.strip()
         normalized_type_lower = normalized_type.lower()
         normalized_color_lower = bride_colour.strip().lower()
+        reference = theme_cache.get()
 
         # Check if wedding type exists in database (case-insensitive)
-        if CulturalColors.query.filter(
-            db.func.lower(CulturalColors.wedding_type) == normalized_type_lower
-        ).first():
+        if normalized_type_lower in reference['cultural_ci']:
             confidence += 0.3
         
         # Check if bride color exists for this wedding type
-        if CulturalColors.query.filter(
-            db.func.lower(CulturalColors.wedding_type) == normalized_type_lower,
-            db.func.lower(CulturalColors.colour_name) == normalized_color_lower
-        ).first():
+        if (normalized_type_lower, normalized_color_lower) in reference['cultural_color_ci']:
             confidence += 0.4
         
         # Check if color rules exist
-        if ColorRules.query.filter(
-            db.func.lower(ColorRules.wedding_type) == normalized_type_lower,
-            db.func.lower(ColorRules.bride_colour) == normalized_color_lower
-        ).first():
+        if (normalized_type_lower, normalized_color_lower) in reference['rules_ci']:
             confidence += 0.3
         
         return min(confidence, 1.0)
@@ -594,13 +567,11 @@ class WeddingDecisionTree:
         """
         wedding_type = wedding_type.strip()
         bride_colour = bride_colour.strip().lower()
+        reference = theme_cache.get()
         
         # If color is already 'default', use the configured default color for this wedding type
         if bride_colour == 'default':
-            default_color = CulturalColors.query.filter(
-                db.func.lower(CulturalColors.wedding_type) == wedding_type.lower(),
-                db.func.lower(CulturalColors.colour_name) == 'default'
-            ).first()
+            default_color = reference['cultural_color_ci'].get((wedding_type.lower(), 'default'))
 
             if default_color:
                 from services.wedding_service import is_color_restricted_for_wedding_type
@@ -608,18 +579,13 @@ class WeddingDecisionTree:
                     return default_color.colour_name
 
             # Fallback to existing logic if default color not found or restricted
-            valid_colors = CulturalColors.query.filter(
-                db.func.lower(CulturalColors.wedding_type) == wedding_type.lower()
-            ).all()
+            valid_colors = reference['cultural_ci'].get(wedding_type.lower(), [])
 
             if not valid_colors:
-                all_types = db.session.query(CulturalColors.wedding_type).distinct().all()
-                for wt_tuple in all_types:
-                    wt_db = wt_tuple[0]
+                for wt_db in reference['wedding_types']:
                     if wedding_type.lower() in wt_db.lower() or wt_db.lower() in wedding_type.lower():
-                        valid_colors = CulturalColors.query.filter_by(wedding_type=wt_db).all()
-                        if valid_colors:
-                            break
+                        valid_colors = reference['cultural'][wt_db]
+                        break
 
             for color in valid_colors:
                 if color.colour_name.lower() != 'default':
@@ -627,10 +593,7 @@ class WeddingDecisionTree:
             return valid_colors[0].colour_name if valid_colors else 'red'
         
         # Try case-insensitive exact match first
-        cultural_color = CulturalColors.query.filter(
-            db.func.lower(CulturalColors.wedding_type) == wedding_type.lower(),
-            db.func.lower(CulturalColors.colour_name) == bride_colour
-        ).first()
+        cultural_color = reference['cultural_color_ci'].get((wedding_type.lower(), bride_colour))
         
         if cultural_color:
             # Check if this color is restricted for this wedding type
@@ -647,25 +610,21 @@ class WeddingDecisionTree:
         target_rgb = color_mappings.get(bride_colour)
         
         # Get all valid colors for this wedding type (case-insensitive)
-        valid_colors = CulturalColors.query.filter(
-            db.func.lower(CulturalColors.wedding_type) == wedding_type.lower()
-        ).all()
+        valid_colors = reference['cultural_ci'].get(wedding_type.lower(), [])
         
         # If no colors found for this wedding type, try similar wedding type
         if not valid_colors:
-            all_types = db.session.query(CulturalColors.wedding_type).distinct().all()
-            for wt_tuple in all_types:
-                wt_db = wt_tuple[0]
+            for wt_db in reference['wedding_types']:
                 if wedding_type.lower() in wt_db.lower() or wt_db.lower() in wedding_type.lower():
-                    valid_colors = CulturalColors.query.filter_by(wedding_type=wt_db).all()
-                    if valid_colors:
-                        break
+                    valid_colors = reference['cultural'][wt_db]
+                    break
         
         if not valid_colors:
             # Last resort: get any color
-            first_color = CulturalColors.query.filter(
-                CulturalColors.colour_name != 'default'
-            ).first()
+            first_color = next(
+                (color for color in reference['cultural_rows'] if color.colour_name != 'default'),
+                None
+            )
             return first_color.colour_name if first_color else 'red'
         
         # Find closest color using Euclidean distance if we have RGB
@@ -793,6 +752,25 @@ class WeddingDecisionTree:
 # Global decision tree instance
 wedding_decision_tree = WeddingDecisionTree()
 
+# Serializes tree builds so concurrent first requests build it only once
+_tree_build_lock = threading.Lock()
+
+
+def get_decision_tree() -> WeddingDecisionTree:
+    """
+    Return the global decision tree, building it on first use.
+    
+    Returns:
+        WeddingDecisionTree: The built decision tree
+    """
+    tree = wedding_decision_tree
+    if tree.root is None:
+        with _tree_build_lock:
+            tree = wedding_decision_tree
+            if tree.root is None:
+                tree.build_tree_from_database()
+    return tree
+
 
 def get_wedding_suggestions_with_decision_tree(wedding_type: str, bride_colour: str) -> Dict:
     """
@@ -805,12 +783,8 @@ def get_wedding_suggestions_with_decision_tree(wedding_type: str, bride_colour:
     Returns:
         Dict: Wedding suggestions
     """
-    # Build tree if not already built
-    if wedding_decision_tree.root is None:
-        wedding_decision_tree.build_tree_from_database()
-    
-    # Make prediction
-    return wedding_decision_tree.predict(wedding_type, bride_colour)
+    # Build tree if not already built, then make prediction
+    return get_decision_tree().predict(wedding_type, bride_colour)
 
 
 def rebuild_decision_tree():
@@ -819,9 +793,13 @@ def rebuild_decision_tree():
     Call this when database rules are updated.
     """
     global wedding_decision_tree
-    wedding_decision_tree = WeddingDecisionTree()
-    wedding_decision_tree.build_tree_from_database()
-    return wedding_decision_tree
+    # Rules edited outside the admin endpoints are picked up here as well
+    theme_cache.invalidate()
+    with _tree_build_lock:
+        tree = WeddingDecisionTree()
+        tree.build_tree_from_database()
+        wedding_decision_tree = tree
+    return tree
 
 
 def print_decision_tree():
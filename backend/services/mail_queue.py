@@ -0,0 +1,44 @@
+"""
+Background delivery of outgoing emails.
+
+Talking to the SMTP server takes from a few hundred milliseconds to several
+seconds, so requests that send mail hand the prepared message to a small
+pool of worker threads and answer straight away. Delivery failures can no
+longer reach the request; the worker logs them.
+"""
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from flask import current_app
+from flask_mail import Message
+
+from extensions import mail
+
+logger = logging.getLogger(__name__)
+
+# SMTP sends are few and slow; two workers keep a burst from queueing long
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='mail')
+
+
+def _deliver(app, msg: Message):
+    """Send ``msg`` inside an application context of ``app``."""
+    with app.app_context():
+        try:
+            mail.send(msg)
+            logger.info("Email %r sent to %s", msg.subject, ', '.join(msg.recipients))
+        except Exception:
+            logger.exception("Error sending email %r to %s", msg.subject, ', '.join(msg.recipients))
+
+
+def send(msg: Message) -> Future:
+    """
+    Queue an email for delivery on a background thread.
+
+    Args:
+        msg (Message): Fully built message
+
+    Returns:
+        Future: Completes once the send has been attempted
+    """
+    return _executor.submit(_deliver, current_app._get_current_object(), msg)
@@ -0,0 +1,82 @@
+"""
+In-process request rate limiting per client address.
+
+Login and password reset requests are counted per client address in fixed
+windows, and once an address is over its limit the request is answered with
+429 before any database or password hashing work. Counters live in each
+worker, so with several workers an address can get up to limit x workers
+requests through; that is enough to blunt floods and password guessing
+without a shared store.
+"""
+
+import threading
+import time
+from functools import wraps
+from typing import Tuple
+
+from flask import current_app, jsonify, request
+
+# (endpoint, address) -> (window start, window length, requests seen in the window)
+_windows = {}
+
+_windows_lock = threading.Lock()
+
+# Expired windows are swept once the table grows past this many entries
+_SWEEP_THRESHOLD = 10000
+
+
+def hit(key: Tuple[str, str], limit: int, window: int) -> int:
+    """
+    Count one request for ``key`` and report how long it has to wait.
+
+    Args:
+        key (Tuple[str, str]): Endpoint and client address
+        limit (int): Requests allowed per window
+        window (int): Window length in seconds
+
+    Returns:
+        int: 0 when the request is allowed, otherwise the seconds until the
+        window resets
+    """
+    now = time.monotonic()
+    with _windows_lock:
+        if len(_windows) > _SWEEP_THRESHOLD:
+            # Endpoints use different window lengths; each entry expires by its own
+            for stale in [k for k, (start, length, _) in _windows.items() if now - start >= length]:
+                del _windows[stale]
+
+        start, _, count = _windows.get(key, (now, window, 0))
+        if now - start >= window:
+            start, count = now, 0
+        count += 1
+        _windows[key] = (start, window, count)
+
+    if count <= limit:
+        return 0
+    return max(1, int(window - (now - start)))
+
+
+def limit(config_key: str, window: int):
+    """
+    Limit a view to ``app.config[config_key]`` requests per client address
+    every ``window`` seconds. A limit of 0 turns the check off.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapped(*args, **kwargs):
+            max_requests = current_app.config.get(config_key, 0)
+            if max_requests > 0:
+                retry_after = hit((request.endpoint, request.remote_addr), max_requests, window)
+                if retry_after:
+                    response = jsonify({"error": "Too many requests. Please try again later."})
+                    response.headers['Retry-After'] = str(retry_after)
+                    return response, 429
+            return view(*args, **kwargs)
+        return wrapped
+    return decorator
+
+
+def reset():
+    """Forget every counter."""
+    with _windows_lock:
+        _windows.clear()
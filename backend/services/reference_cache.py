@@ -0,0 +1,50 @@
+"""
+Shared per-worker store for the reference data caches.
+
+``theme_cache`` and ``company_cache`` keep their entries here under their
+own names. An entry lives for ``REFERENCE_CACHE_TTL`` seconds (0 disables
+caching) and is dropped early through ``invalidate()`` by the worker that
+changes the underlying rows.
+"""
+
+import threading
+import time
+
+from flask import current_app
+
+
+_cache = {}
+
+# Serializes reloads so concurrent requests build an entry only once
+_cache_lock = threading.Lock()
+
+
+def get(key, build):
+    """
+    Return the cached value for ``key``, rebuilding it when missing or expired.
+
+    Args:
+        key (str): Cache entry name
+        build (callable): Loads the value from the database
+
+    Returns:
+        The cached (or freshly built) value
+    """
+    ttl = current_app.config.get('REFERENCE_CACHE_TTL', 300)
+    if ttl <= 0:
+        return build()
+
+    entry = _cache.get(key)
+    if entry is None or time.monotonic() - entry[0] > ttl:
+        with _cache_lock:
+            entry = _cache.get(key)
+            if entry is None or time.monotonic() - entry[0] > ttl:
+                entry = (time.monotonic(), build())
+                _cache[key] = entry
+    return entry[1]
+
+
+def invalidate(key):
+    """Drop the entry ``key`` so the next read builds it again."""
+    with _cache_lock:
+        _cache.pop(key, None)
@@ -0,0 +1,190 @@
+"""
+In-process cache of the wedding reference tables.
+
+Cultural colors, color rules, color mappings, restricted colours and food
+locations only change through the admin data endpoints, so the suggestion
+services read them from a snapshot of plain rows instead of querying the
+database for every lookup. Wedding type names and cultural color keys, used
+by the admin reference checks, are cached separately so edits to the other
+tables keep them warm.
+
+Each worker keeps its entries in ``reference_cache`` for
+``REFERENCE_CACHE_TTL`` seconds, which bounds how long other workers serve
+data older than an admin edit; the worker that handles the edit drops the
+affected entry straight away through ``invalidate()``,
+``invalidate_wedding_types()`` or ``invalidate_cultural_colors()``.
+"""
+
+from typing import Dict
+
+from sqlalchemy import select
+
+from extensions import db
+from models.wedding_planning import (
+    CulturalColors,
+    ColorRules,
+    FoodLocations,
+    ColorMappings,
+    RestrictedColours,
+    WeddingType
+)
+from services import reference_cache
+
+
+def _ci(value: str) -> str:
+    """Return the case-insensitive lookup key for ``value``."""
+    return value.strip().lower()
+
+
+def _build_snapshot() -> Dict:
+    """
+    Read the reference tables and index the rows for the service lookups.
+
+    Keys ending in ``_ci`` are lower-cased and stripped, matching the
+    case-insensitive collation of the MySQL columns the lookups used to
+    filter on; when several rows collide on such a key the first one in
+    primary key order wins, as ``.first()`` did.
+
+    Returns:
+        Dict: Lookup tables keyed by wedding type / color name
+    """
+    cultural_rows = db.session.execute(
+        select(
+            CulturalColors.wedding_type,
+            CulturalColors.colour_name,
+            CulturalColors.rgb,
+            CulturalColors.cultural_significance
+        ).order_by(CulturalColors.wedding_type, CulturalColors.colour_name)
+    ).all()
+    rule_rows = db.session.execute(
+        select(
+            ColorRules.wedding_type,
+            ColorRules.bride_colour,
+            ColorRules.groom_colour,
+            ColorRules.bridesmaids_colour,
+            ColorRules.best_men_colour,
+            ColorRules.flower_deco_colour,
+            ColorRules.hall_decor_colour
+        ).order_by(ColorRules.wedding_type, ColorRules.bride_colour)
+    ).all()
+    food_rows = db.session.execute(
+        select(
+            FoodLocations.wedding_type,
+            FoodLocations.food_menu,
+            FoodLocations.drinks,
+            FoodLocations.pre_shoot_locations
+        ).order_by(FoodLocations.wedding_type)
+    ).all()
+    mapping_rows = db.session.execute(
+        select(ColorMappings.color_name, ColorMappings.rgb).order_by(ColorMappings.color_name)
+    ).all()
+    restricted_rows = db.session.execute(
+        select(RestrictedColours.wedding_type, RestrictedColours.restricted_colour)
+    ).all()
+
+    cultural, cultural_ci = {}, {}
+    cultural_color, cultural_color_ci, colour_rgb_ci = {}, {}, {}
+    for row in cultural_rows:
+        wedding_type_ci = _ci(row.wedding_type)
+        colour_name_ci = _ci(row.colour_name)
+        cultural.setdefault(row.wedding_type, []).append(row)
+        cultural_ci.setdefault(wedding_type_ci, []).append(row)
+        cultural_color[(row.wedding_type, row.colour_name)] = row
+        cultural_color_ci.setdefault((wedding_type_ci, colour_name_ci), row)
+        colour_rgb_ci.setdefault(colour_name_ci, row.rgb)
+
+    rules, rules_ci, rules_by_type_ci, rule_counts = {}, {}, {}, {}
+    for row in rule_rows:
+        wedding_type_ci = _ci(row.wedding_type)
+        rules[(row.wedding_type, row.bride_colour)] = row
+        rules_ci.setdefault((wedding_type_ci, _ci(row.bride_colour)), row)
+        rules_by_type_ci.setdefault(wedding_type_ci, []).append(row)
+        rule_counts[row.wedding_type] = rule_counts.get(row.wedding_type, 0) + 1
+
+    food, food_ci = {}, {}
+    for row in food_rows:
+        food[row.wedding_type] = row
+        food_ci.setdefault(_ci(row.wedding_type), row)
+
+    mappings, mappings_ci = {}, {}
+    for row in mapping_rows:
+        mappings[row.color_name] = row.rgb
+        mappings_ci.setdefault(_ci(row.color_name), row.rgb)
+
+    return {
+        'cultural_rows': cultural_rows,
+        'wedding_types': list(cultural),
+        'cultural': cultural,
+        'cultural_ci': cultural_ci,
+        'cultural_color': cultural_color,
+        'cultural_color_ci': cultural_color_ci,
+        'colour_rgb_ci': colour_rgb_ci,
+        'rules': rules,
+        'rules_ci': rules_ci,
+        'rules_by_type_ci': rules_by_type_ci,
+        'rule_counts': rule_counts,
+        'food': food,
+        'food_ci': food_ci,
+        'food_types': list(food),
+        'mappings': mappings,
+        'mappings_ci': mappings_ci,
+        'restricted': frozenset(
+            (_ci(row.wedding_type), _ci(row.restricted_colour)) for row in restricted_rows
+        ),
+    }
+
+
+def _load_wedding_type_names() -> frozenset:
+    """Read the set of wedding type names."""
+    return frozenset(db.session.execute(select(WeddingType.name)).scalars())
+
+
+def _load_cultural_color_keys() -> frozenset:
+    """Read the set of (wedding type, colour name) cultural color keys."""
+    rows = db.session.execute(select(CulturalColors.wedding_type, CulturalColors.colour_name))
+    return frozenset(rows.tuples())
+
+
+def get() -> Dict:
+    """
+    Return the reference data snapshot, loading it when missing or expired.
+
+    Returns:
+        Dict: Lookup tables built by ``_build_snapshot()``
+    """
+    return reference_cache.get('reference', _build_snapshot)
+
+
+def wedding_type_names() -> frozenset:
+    """
+    Return the set of wedding type names, loading it when missing or expired.
+
+    Returns:
+        frozenset: Names from the wedding_types table
+    """
+    return reference_cache.get('wedding_type_names', _load_wedding_type_names)
+
+
+def cultural_color_keys() -> frozenset:
+    """
+    Return the set of cultural color keys, loading it when missing or expired.
+    
+    Returns:
+        frozenset: (wedding_type, colour_name) pairs from the cultural_colors table
+    """
+    return reference_cache.get('cultural_color_keys', _load_cultural_color_keys)
+
+
+def invalidate():
+    """Drop the reference data snapshot so the next lookup reads the tables again."""
+    reference_cache.invalidate('reference')
+
+
+def invalidate_wedding_types():
+    """Drop the cached wedding type names."""
+    reference_cache.invalidate('wedding_type_names')
+
+
+def invalidate_cultural_colors():
+    """Drop the cached cultural color keys."""
+    reference_cache.invalidate('cultural_color_keys')
@@ -2,24 +2,21 @@
 Wedding Planning Service with Database-Driven Color Logic.
 
 This module provides core wedding planning functionality including:
-- Color validation and mapping using database lookups
+- Color validation and mapping using the cached reference tables
 - Euclidean distance calculations for unknown colors
 - Wedding type and color information retrieval
 """
 
+import logging
 import math
 import re
 from typing import Dict, List, Optional, Tuple
 
-from models.wedding_planning import (
-    CulturalColors,
-    ColorRules,
-    FoodLocations,
-    ColorMappings,
-    RestrictedColours,
-    WeddingType
-)
+from models.wedding_planning import WeddingType
 from extensions import db
+from services import theme_cache
+
+logger = logging.getLogger(__name__)
 
 
 def calculate_euclidean_distance(rgb1: str, rgb2: str) -> float:
@@ -58,10 +55,7 @@ def parse_rgb_from_color_name(color_name: str) -> Optional[str]:
     if not color_name:
         return None
         
-    # Query database for color mapping
-    color_mapping = ColorMappings.query.filter_by(color_name=color_name.lower()).first()
-    
-    return color_mapping.rgb if color_mapping else None
+    return theme_cache.get()['mappings_ci'].get(color_name.lower().strip())
 
 
 def get_default_color_for_wedding_type(wedding_type: str) -> Optional[str]:
@@ -71,10 +65,9 @@ def get_default_color_for_wedding_type(wedding_type: str) -> Optional[str]:
     if not wedding_type:
         return None
 
-    default_color = CulturalColors.query.filter(
-        db.func.lower(CulturalColors.wedding_type) == wedding_type.lower().strip(),
-        db.func.lower(CulturalColors.colour_name) == 'default'
-    ).first()
+    default_color = theme_cache.get()['cultural_color_ci'].get(
+        (wedding_type.lower().strip(), 'default')
+    )
 
     return default_color.colour_name if default_color else None
 
@@ -86,10 +79,9 @@ def get_default_color_rgb_for_wedding_type(wedding_type: str) -> Optional[str]:
     if not wedding_type:
         return None
 
-    default_color = CulturalColors.query.filter(
-        db.func.lower(CulturalColors.wedding_type) == wedding_type.lower().strip(),
-        db.func.lower(CulturalColors.colour_name) == 'default'
-    ).first()
+    default_color = theme_cache.get()['cultural_color_ci'].get(
+        (wedding_type.lower().strip(), 'default')
+    )
 
     return default_color.rgb if default_color else None
 
@@ -136,7 +128,7 @@ def find_closest_valid_color(target_color: str, wedding_type: str) -> str:
         return default_color if default_color else 'default'
     
     # Get all valid colors for this wedding type
-    valid_colors = CulturalColors.query.filter_by(wedding_type=wedding_type).all()
+    valid_colors = theme_cache.get()['cultural_ci'].get(wedding_type.lower().strip())
     
     if not valid_colors:
         return default_color if default_color else 'default'
@@ -252,33 +244,27 @@ def find_closest_cultural_color_by_rgb(input_rgb: List[int], wedding_type: str)
     Returns:
         str: Closest valid cultural color name (never returns 'default')
     """
-    from extensions import db
+    reference = theme_cache.get()
     
     # Try exact match first
-    cultural_colors = CulturalColors.query.filter_by(wedding_type=wedding_type).all()
+    cultural_colors = reference['cultural'].get(wedding_type)
     
     # If no exact match, try case-insensitive search
     if not cultural_colors:
-        cultural_colors = CulturalColors.query.filter(
-            db.func.lower(CulturalColors.wedding_type) == wedding_type.lower().strip()
-        ).all()
+        cultural_colors = reference['cultural_ci'].get(wedding_type.lower().strip())
     
     # If still no match, find closest wedding type by name similarity
     if not cultural_colors:
-        all_wedding_types = db.session.query(CulturalColors.wedding_type).distinct().all()
         # Find wedding type that contains the input (e.g., "Tamil Wedding" -> "Tamil Hindu Wedding")
-        for wt_tuple in all_wedding_types:
-            wt_db = wt_tuple[0]
+        for wt_db in reference['wedding_types']:
             if wedding_type.lower().strip() in wt_db.lower() or wt_db.lower() in wedding_type.lower().strip():
-                cultural_colors = CulturalColors.query.filter_by(wedding_type=wt_db).all()
-                if cultural_colors:
-                    break
+                cultural_colors = reference['cultural'][wt_db]
+                break
     
     # If still no colors found, get first available color from any wedding type as last resort
     if not cultural_colors:
-        first_color = CulturalColors.query.first()
-        if first_color:
-            return first_color.colour_name
+        if reference['cultural_rows']:
+            return reference['cultural_rows'][0].colour_name
         return 'red'  # Absolute last resort
     
     default_color = get_default_color_for_wedding_type(wedding_type)
@@ -354,10 +340,9 @@ def validate_and_map_bride_color(wedding_type: str, bride_color: str) -> Tuple[s
         return (mapped_color, message)
     
     # Check if the exact color exists and is valid for this wedding type
-    cultural_color = CulturalColors.query.filter_by(
-        wedding_type=wedding_type,
-        colour_name=original_color
-    ).first()
+    cultural_color = theme_cache.get()['cultural_color_ci'].get(
+        (wedding_type.lower().strip(), original_color.strip())
+    )
     
     if cultural_color:
         # Color exists and is not restricted - use it
@@ -390,17 +375,18 @@ def get_wedding_suggestions(wedding_type: str, bride_color: str) -> Dict:
     # Validate and map bride's color
     mapped_bride_color, _ = validate_and_map_bride_color(wedding_type, bride_color)
     
-    # Get color suggestions from database
-    color_rule = ColorRules.query.filter_by(
-        wedding_type=wedding_type,
-        bride_colour=mapped_bride_color
-    ).first()
+    reference = theme_cache.get()
+
+    # Get color suggestions from the reference data
+    color_rule = reference['rules_ci'].get(
+        (wedding_type.lower().strip(), mapped_bride_color.lower().strip())
+    )
     
     if not color_rule:
         raise KeyError(f"No color rules found for {wedding_type} with bride color {mapped_bride_color}")
     
-    # Get food and location suggestions from database
-    food_location = FoodLocations.query.filter_by(wedding_type=wedding_type).first()
+    # Get food and location suggestions from the reference data
+    food_location = reference['food_ci'].get(wedding_type.lower().strip())
     
     if not food_location:
         raise ValueError(f"No food and location data found for {wedding_type}")
@@ -441,12 +427,8 @@ def get_available_wedding_types() -> List[str]:
         return [wt.name for wt in wedding_types]
     
     # Fallback: if wedding_types table is empty, get from cultural_colors (for migration)
-    print("Warning: wedding_types table is empty. Falling back to cultural_colors table.")
-    wedding_types_fallback = CulturalColors.query.with_entities(
-        CulturalColors.wedding_type
-    ).distinct().all()
-    
-    return [wt[0] for wt in wedding_types_fallback]
+    logger.warning("wedding_types table is empty. Falling back to cultural_colors table.")
+    return list(theme_cache.get()['wedding_types'])
 
 
 def get_wedding_type_details(wedding_type_name: str) -> Optional[Dict]:
@@ -481,14 +463,15 @@ def get_available_colors_for_wedding_type(wedding_type: str) -> List[Dict]:
     Returns:
         List[Dict]: List of color information dictionaries (excluding restricted colors)
     """
-    colors = CulturalColors.query.filter_by(wedding_type=wedding_type).all()
+    colors = theme_cache.get()['cultural_ci'].get(wedding_type.lower().strip(), [])
     
     # Filter out restricted colors
     available_colors = []
     for color in colors:
         # Skip restricted colors
         if not is_color_restricted_for_wedding_type(wedding_type, color.colour_name):
-            available_colors.append(color.to_dict())
+            # Rows carry the same fields, in the same order, as CulturalColors.to_dict()
+            available_colors.append(color._asdict())
     
     return available_colors
 
@@ -499,7 +482,7 @@ def get_enhanced_color_details(wedding_type: str, color_rule) -> Dict:
     
     Args:
         wedding_type (str): Wedding type
-        color_rule: ColorRules database object
+        color_rule: Color rule row (ColorRules fields)
     
     Returns:
         Dict: Enhanced color details with RGB and hex values
@@ -619,7 +602,7 @@ def build_color_swatches(color_name: str) -> List[Dict[str, Optional[str]]]:
 
 def get_rgb_for_color_name(color_name: str, _allow_composite: bool = True) -> Optional[str]:
     """
-    Get RGB values for a color name from database.
+    Get RGB values for a color name from the reference data.
     
     Args:
         color_name (str): Color name to look up
@@ -632,19 +615,16 @@ def get_rgb_for_color_name(color_name: str, _allow_composite: bool = True) -> Op
         return None
 
     normalized_name = color_name.strip().lower()
+    reference = theme_cache.get()
 
-    cultural_color = CulturalColors.query.filter(
-        db.func.lower(CulturalColors.colour_name) == normalized_name
-    ).first()
-    if cultural_color:
-        return cultural_color.rgb
+    cultural_rgb = reference['colour_rgb_ci'].get(normalized_name)
+    if cultural_rgb:
+        return cultural_rgb
     
     # Try color mappings
-    color_mapping = ColorMappings.query.filter(
-        db.func.lower(ColorMappings.color_name) == normalized_name
-    ).first()
-    if color_mapping:
-        return color_mapping.rgb
+    mapped_rgb = reference['mappings_ci'].get(normalized_name)
+    if mapped_rgb:
+        return mapped_rgb
 
     # Fallback lookup for common color names not present in database tables
     if normalized_name in FALLBACK_RGB_MAP:
@@ -706,13 +686,7 @@ def is_color_restricted_for_wedding_type(wedding_type: str, color_name: str) ->
     Returns:
         bool: True if color is restricted for this wedding type, False otherwise
     """
-    # Query the restricted_colours table
-    restricted = RestrictedColours.query.filter(
-        db.func.lower(RestrictedColours.wedding_type) == wedding_type.lower().strip(),
-        db.func.lower(RestrictedColours.restricted_colour) == color_name.lower().strip()
-    ).first()
-    
-    return restricted is not None
+    return (wedding_type.lower().strip(), color_name.lower().strip()) in theme_cache.get()['restricted']
 
 
 def is_color_restricted(wedding_type: str, color_name: str) -> bool:
@@ -741,10 +715,9 @@ def get_cultural_significance(wedding_type: str, color_name: str) -> Optional[st
     Returns:
         Optional[str]: Cultural significance if available, None otherwise
     """
-    cultural_color = CulturalColors.query.filter_by(
-        wedding_type=wedding_type,
-        colour_name=color_name.lower()
-    ).first()
+    cultural_color = theme_cache.get()['cultural_color_ci'].get(
+        (wedding_type.lower().strip(), color_name.lower().strip())
+    )
     
     return cultural_color.cultural_significance if cultural_color else None
 
@@ -768,25 +741,18 @@ def calculate_suggestion_confidence(wedding_type: str, bride_color: str) -> floa
     normalized_type = wedding_type.strip()
     normalized_type_lower = normalized_type.lower()
     normalized_color_lower = bride_color.strip().lower()
+    reference = theme_cache.get()
 
     # Check if wedding type exists (case-insensitive)
-    if CulturalColors.query.filter(
-        db.func.lower(CulturalColors.wedding_type) == normalized_type_lower
-    ).first():
+    if normalized_type_lower in reference['cultural_ci']:
         confidence += 0.3
     
     # Check if bride color exists for this wedding type
-    if CulturalColors.query.filter(
-        db.func.lower(CulturalColors.wedding_type) == normalized_type_lower,
-        db.func.lower(CulturalColors.colour_name) == normalized_color_lower
-    ).first():
+    if (normalized_type_lower, normalized_color_lower) in reference['cultural_color_ci']:
         confidence += 0.4
     
     # Check if color rules exist
-    if ColorRules.query.filter(
-        db.func.lower(ColorRules.wedding_type) == normalized_type_lower,
-        db.func.lower(ColorRules.bride_colour) == normalized_color_lower
-    ).first():
+    if (normalized_type_lower, normalized_color_lower) in reference['rules_ci']:
         confidence += 0.3
     
     return min(confidence, 1.0)
\ No newline at end of file
@@ -1,10 +1,13 @@
 from datetime import datetime, date
 from decimal import Decimal
 
-from models.user import User
+from werkzeug.security import generate_password_hash
+
+from models.user import ADMIN_FLAG, PLANNER_FLAG, User
 from models.project import Project
 from models.checklist_task import ChecklistTask
 from models.budget_item import BudgetItem
+from models.password_reset_token import PasswordResetToken
 
 
 def test_user_to_dict_shape_and_values():
@@ -33,6 +36,30 @@ def test_user_to_dict_shape_and_values():
     assert "password" not in d
 
 
+def test_user_role_flags_follow_role():
+    u = User(username="p", email="p@wedding.com", role="planner")
+    assert u.role_flags == PLANNER_FLAG
+
+    u.role = "admin"
+    assert u.role_flags == ADMIN_FLAG
+    assert not u.role_flags & PLANNER_FLAG
+
+
+def test_user_password_hashing_argon2_and_legacy():
+    u = User(username="p", email="p@wedding.com", role="planner")
+    u.set_password("secret123")
+    assert u.password.startswith("$argon2id$")
+    assert u.check_password("secret123")
+    assert not u.check_password("wrong")
+    assert not u.password_needs_rehash()
+
+    # Hashes stored before argon2 still verify and are flagged for upgrade
+    u.password = generate_password_hash("secret123")
+    assert u.check_password("secret123")
+    assert not u.check_password("wrong")
+    assert u.password_needs_rehash()
+
+
 def test_project_to_dict_shape_and_values():
     p = Project(
         id=5,
@@ -72,6 +99,14 @@ def test_project_to_dict_shape_and_values():
     assert d["updated_at"].startswith("2025-01-02T09:00:00")
 
 
+def test_project_to_dict_keeps_zero_budget():
+    p = Project(id=6, bride_name="A", groom_name="B", budget=0.0)
+    assert p.to_dict()["budget"] == 0.0
+
+    p.budget = None
+    assert p.to_dict()["budget"] is None
+
+
 def test_checklist_task_to_dict_defaults_and_dates():
     t = ChecklistTask(
         id=9,
@@ -101,6 +136,23 @@ def test_checklist_task_to_dict_defaults_and_dates():
     assert d["updated_at"].startswith("2025-01-04T18:45:00")
 
 
+def test_checklist_task_assign_to_caches_assignee_details():
+    planner = User(id=2, username="p", email="p@wedding.com", name="Pat", role="planner")
+    t = ChecklistTask(id=1, project_id=5, title="Book venue", status="pending")
+
+    t.assign_to(planner)
+    d = t.to_dict()
+    assert d["assigned_to"] == 2
+    assert d["assigned_to_name"] == "Pat"
+    assert d["assigned_to_email"] == "p@wedding.com"
+
+    t.assign_to(None)
+    d = t.to_dict()
+    assert d["assigned_to"] is None
+    assert d["assigned_to_name"] is None
+    assert d["assigned_to_email"] is None
+
+
 def test_budget_item_to_dict_casts_amounts_and_dates():
     b = BudgetItem(
         id=11,
@@ -129,3 +181,10 @@ def test_budget_item_to_dict_casts_amounts_and_dates():
     assert d["created_at"].startswith("2025-01-05T14:00:00")
     assert d["updated_at"].startswith("2025-01-06T16:30:00")
 
+
+def test_password_reset_token_stores_only_the_hash():
+    reset_token = PasswordResetToken.create_token(user_id=1)
+    assert reset_token.token
+    assert reset_token.token_hash == PasswordResetToken.hash_token(reset_token.token)
+    assert reset_token.token_hash != reset_token.token
+    assert len(reset_token.token_hash) == 64
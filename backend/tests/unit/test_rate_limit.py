@@ -0,0 +1,32 @@
+import services.rate_limit as rate_limit
+
+
+def test_hit_blocks_over_limit_until_window_resets(monkeypatch):
+    rate_limit.reset()
+    now = [1000.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    key = ("auth.login", "10.0.0.1")
+
+    assert [rate_limit.hit(key, 2, 60) for _ in range(2)] == [0, 0]
+    now[0] += 15
+    assert rate_limit.hit(key, 2, 60) == 45
+    # Other addresses keep their own window
+    assert rate_limit.hit(("auth.login", "10.0.0.2"), 2, 60) == 0
+
+    now[0] += 45
+    assert rate_limit.hit(key, 2, 60) == 0
+
+
+def test_sweep_keeps_windows_that_have_not_expired(monkeypatch):
+    rate_limit.reset()
+    now = [1000.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(rate_limit, "_SWEEP_THRESHOLD", 1)
+    reset_key = ("auth.forgot_password", "10.0.0.1")
+
+    assert rate_limit.hit(reset_key, 1, 3600) == 0
+    now[0] += 120
+    # A short-window hit sweeps the table but the hourly window is still open
+    rate_limit.hit(("auth.login", "10.0.0.2"), 5, 60)
+    rate_limit.hit(("auth.login", "10.0.0.3"), 5, 60)
+    assert rate_limit.hit(reset_key, 1, 3600) == 3480
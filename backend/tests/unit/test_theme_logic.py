@@ -1,6 +1,8 @@
 import pytest
+from flask import Flask
 
 import services.wedding_service as ws
+from services import theme_cache
 
 
 def test_process_hex_color_restricted_black(monkeypatch):
@@ -60,3 +62,46 @@ def test_build_color_swatches_for_composite(monkeypatch):
     assert swatches[0]["name"].lower() == "red" and swatches[0]["rgb"] == "255,0,0"
     assert swatches[1]["name"].lower() == "white" and swatches[1]["rgb"] == "255,255,255"
 
+
+def test_restriction_and_confidence_read_reference_snapshot(monkeypatch):
+    # Lookups are answered from the cached snapshot, case-insensitively
+    snapshot = {
+        "restricted": frozenset({("tamil hindu wedding", "black")}),
+        "cultural_ci": {"tamil hindu wedding": []},
+        "cultural_color_ci": {("tamil hindu wedding", "red"): None},
+        "rules_ci": {},
+    }
+    monkeypatch.setattr(ws.theme_cache, "get", lambda: snapshot)
+
+    assert ws.is_color_restricted_for_wedding_type(" Tamil Hindu Wedding ", "Black")
+    assert not ws.is_color_restricted_for_wedding_type("Tamil Hindu Wedding", "red")
+    assert ws.calculate_suggestion_confidence("Tamil Hindu Wedding", "Red") == pytest.approx(0.7)
+
+
+def test_bride_color_lookups_ignore_case(monkeypatch):
+    # Admin-entered names like "Red" still match, as under the MySQL collation
+    snapshot = {
+        "restricted": frozenset(),
+        "cultural_color_ci": {("tamil hindu wedding", "red"): object()},
+        "mappings_ci": {"red": "255,0,0"},
+    }
+    monkeypatch.setattr(ws.theme_cache, "get", lambda: snapshot)
+
+    assert ws.validate_and_map_bride_color("Tamil Hindu Wedding", "Red") == ("red", None)
+    assert ws.parse_rgb_from_color_name(" RED ") == "255,0,0"
+
+
+def test_theme_cache_reuses_snapshot_until_invalidated(monkeypatch):
+    loads = []
+    monkeypatch.setattr(theme_cache, "_build_snapshot", lambda: loads.append(1) or {"n": len(loads)})
+    app = Flask(__name__)
+    app.config["REFERENCE_CACHE_TTL"] = 300
+    theme_cache.invalidate()
+
+    with app.app_context():
+        assert theme_cache.get() == {"n": 1}
+        assert theme_cache.get() == {"n": 1}
+
+        theme_cache.invalidate()
+        assert theme_cache.get() == {"n": 2}
+    theme_cache.invalidate()
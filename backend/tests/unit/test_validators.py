@@ -1,6 +1,8 @@
 import pytest
 from decimal import Decimal
 
+from routes.admin_data_management import _FOOD_LOCATION_FIELDS, _read_required_fields
+from routes.admin_profile import _validate_new_password, _validate_user_fields
 from routes.budget import _parse_amount, _parse_expense_date
 
 
@@ -42,3 +44,28 @@ def test_parse_expense_date_invalid_format():
     with pytest.raises(ValueError):
         _parse_expense_date("invalid")
 
+
+def test_read_required_fields_strips_values():
+    data = {"wedding_type": " Kandyan ", "food_menu": "Rice", "drinks": "Tea ", "pre_shoot_locations": "Kandy"}
+    values, error = _read_required_fields(data, _FOOD_LOCATION_FIELDS)
+    assert error is None
+    assert values == {"wedding_type": "Kandyan", "food_menu": "Rice", "drinks": "Tea", "pre_shoot_locations": "Kandy"}
+
+
+def test_read_required_fields_reports_first_missing_field():
+    data = {"wedding_type": "Kandyan", "food_menu": "  ", "drinks": None}
+    _, error = _read_required_fields(data, _FOOD_LOCATION_FIELDS)
+    assert error == "Food menu is required"
+
+
+def test_validate_user_fields():
+    assert _validate_user_fields("Nimal", "nimal@example.com", "planner") is None
+    assert _validate_user_fields("", "nimal@example.com", "planner") == "Name is required"
+    assert _validate_user_fields("Nimal", "not-an-email", "planner") == "Valid email is required"
+    assert _validate_user_fields("Nimal", "nimal@example.com", "guest").startswith("Role must be")
+
+
+def test_validate_new_password():
+    assert _validate_new_password("secret1", "secret1") is None
+    assert _validate_new_password("abc", "abc") == "Password must be at least 6 characters long"
+    assert _validate_new_password("secret1", "secret2") == "Password and confirm password do not match"